@@ -5,26 +5,27 @@ This package provides the runtime environment for Visual Agent capabilities.
 
 import os
 import sys
+from typing import TYPE_CHECKING
 
-# Make sure daemon directory is in path
-sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
-
-# Import the main functionality
-from daemon.main import run_daemon
-
-# Import logging utilities
-from daemon.utils.logging import (
-    LogCategory,
-    configure_logging,
-    debug,
-    error,
-    info,
-    model,
-    server,
-    system,
-    ui,
-    warning,
-)
+# Make sure daemon directory is in path (once, so re-imports do not grow it)
+_PARENT = os.path.dirname(os.path.dirname(__file__))
+if _PARENT not in sys.path:
+    sys.path.insert(0, _PARENT)
+
+if TYPE_CHECKING:
+    from daemon.main import run_daemon
+    from daemon.utils.logging import (
+        LogCategory,
+        configure_logging,
+        debug,
+        error,
+        info,
+        model,
+        server,
+        system,
+        ui,
+        warning,
+    )
 
 # Export all interfaces
 __all__ = [
@@ -41,6 +42,26 @@ __all__ = [
     "server",
 ]
 
+
+def __getattr__(name: str):
+    """Import the public interfaces on first access.
+
+    Importing the package stays cheap; livekit, bithuman and the web stack are
+    only loaded once ``run_daemon`` is actually needed.
+    """
+    if name == "run_daemon":
+        from daemon.main import run_daemon as value
+    elif name in __all__:
+        from daemon.utils import logging
+
+        value = getattr(logging, name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
 # Set the package version
 __version__ = "0.1.0"
 
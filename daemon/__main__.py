@@ -7,20 +7,55 @@ This file allows the daemon to be run with:
 import argparse
 import sys
 
-from daemon.main import run_daemon
+_PARSER: argparse.ArgumentParser | None = None
 
-if __name__ == "__main__":
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description="bitHuman Visual Agent Daemon")
-    parser.add_argument("--port", type=int, help="Specify port for the server")
-    parser.add_argument("--model", help="Path to the model file")
-    parser.add_argument(
-        "--verbose", "-v", action="store_true", help="Enable verbose logging"
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the daemon's command line parser, building it on first use."""
+    global _PARSER
+
+    if _PARSER is None:
+        parser = argparse.ArgumentParser(description="bitHuman Visual Agent Daemon")
+        parser.add_argument("--port", type=int, help="Specify port for the server")
+        parser.add_argument("--model", help="Path to the model file")
+        parser.add_argument(
+            "--verbose", "-v", action="store_true", help="Enable verbose logging"
+        )
+        parser.add_argument(
+            "--grace-period",
+            type=float,
+            help="Seconds to allow for clean shutdown after SIGINT/SIGTERM",
+        )
+        _PARSER = parser
+    return _PARSER
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line and run the daemon.
+
+    run_daemon is the single exception boundary for the daemon, so errors
+    raised while starting or running it are logged and turned into an exit
+    code there.
+
+    Args:
+        argv: Arguments to parse, defaults to sys.argv[1:]
+
+    Returns:
+        Exit code (0 for success, non-zero for error)
+    """
+    args = _get_parser().parse_args(argv)
+
+    # Imported only once the arguments are valid so --help and usage errors
+    # return without loading the model runtime and web stack
+    from daemon.main import run_daemon
+
+    return run_daemon(
+        model_path=args.model,
+        port=args.port,
+        verbose=args.verbose,
+        grace_period=args.grace_period,
     )
-    args = parser.parse_args()
 
-    # Run the daemon with parsed arguments
-    exit_code = run_daemon(model_path=args.model, port=args.port, verbose=args.verbose)
 
-    # Exit with the appropriate code
-    sys.exit(exit_code)
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,10 +1,8 @@
-import asyncio
+from functools import lru_cache
 
-import numpy as np
 from livekit import rtc
 from livekit.agents import NOT_GIVEN, NotGivenOr, stt, utils, vad
 from livekit.agents.voice import Agent, AgentSession
-from livekit.agents.voice.events import UserState
 from loguru import logger
 
 from bithuman import AudioChunk
@@ -26,6 +24,68 @@ class EchoLocalAudioIO(LocalAudioIO):
         await super().capture_frame(audio_chunk)
 
 
+class _FastAudioByteStream(utils.audio.AudioByteStream):
+    """AudioByteStream that advances a read offset instead of re-slicing its buffer.
+
+    The base implementation copies the remaining bytes into a new buffer for
+    every frame it emits. Here the consumed prefix is only dropped once it makes
+    up more than half of the buffer.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._head = 0
+
+    def push(self, data: bytes) -> list[rtc.AudioFrame]:
+        self._buf.extend(data)
+
+        frames = []
+        frame_size = self._bytes_per_frame
+        sample_rate = self._sample_rate
+        num_channels = self._num_channels
+        samples_per_channel = frame_size // (2 * num_channels)
+        head = self._head
+        end = len(self._buf)
+        with memoryview(self._buf) as view:
+            while end - head >= frame_size:
+                # AudioFrame copies the data, so the view can be released after
+                frames.append(
+                    rtc.AudioFrame(
+                        data=view[head : head + frame_size],
+                        sample_rate=sample_rate,
+                        num_channels=num_channels,
+                        samples_per_channel=samples_per_channel,
+                    )
+                )
+                head += frame_size
+
+        if head > end // 2:
+            del self._buf[:head]
+            head = 0
+        self._head = head
+        return frames
+
+    write = push
+
+    def flush(self) -> list[rtc.AudioFrame]:
+        del self._buf[: self._head]
+        self._head = 0
+        return super().flush()
+
+
+@lru_cache(maxsize=8)
+def _silence_frame(
+    sample_rate: int, num_channels: int, samples_per_channel: int
+) -> rtc.AudioFrame:
+    """Return a shared all-zero frame; frames are never mutated after creation."""
+    return rtc.AudioFrame(
+        data=bytes(samples_per_channel * num_channels * 2),
+        sample_rate=sample_rate,
+        num_channels=num_channels,
+        samples_per_channel=samples_per_channel,
+    )
+
+
 class EchoAgent(Agent):
     def __init__(
         self,
@@ -42,12 +102,9 @@ class EchoAgent(Agent):
 
 
 class EchoAgentSession(AgentSession):
-    async def _forward_echo_audio_task(
-        self, buffer: utils.aio.Chan[rtc.AudioFrame]
-    ) -> None:
-        async for frame in buffer:
-            if self.output.audio:
-                await self.output.audio.capture_frame(frame)
+    # silent 10 ms sub-frames still forwarded after the user stops speaking, so
+    # the runtime can finish the utterance before the echo output goes quiet
+    echo_silence_tail: int = 50
 
     async def _forward_audio_task(self) -> None:
         logger.info("Forwarding audio task")
@@ -55,52 +112,45 @@ class EchoAgentSession(AgentSession):
         if audio_input is None:
             return
 
-        echo_audio_buffer = utils.aio.Chan[rtc.AudioFrame](maxsize=10)
-        echo_audio_atask = asyncio.create_task(
-            self._forward_echo_audio_task(echo_audio_buffer)
-        )
-        bstreamer: utils.audio.AudioByteStream | None = None
-        try:
-            prev_state: UserState = "away"
-            async for frame in audio_input:
-                if not self._activity:
-                    continue
-                self._activity.push_audio(frame)
+        bstreamer: _FastAudioByteStream | None = None
+        silence: rtc.AudioFrame | None = None
+        silent_frames = 0
+        async for frame in audio_input:
+            activity = self._activity
+            if not activity:
+                continue
+            activity.push_audio(frame)
 
-                if not isinstance(self.current_agent, EchoAgent):
-                    continue
+            # read per frame: model_loader may swap _agent directly while no
+            # activity is running, bypassing start() and update_agent()
+            if not isinstance(self._agent, EchoAgent):
+                continue
 
-                # forward audio directly if in echo mode
-                if bstreamer is None:
-                    bstreamer = utils.audio.AudioByteStream(
-                        sample_rate=frame.sample_rate,
-                        num_channels=frame.num_channels,
-                        samples_per_channel=int(frame.sample_rate / 100),
-                    )
-                for f in bstreamer.push(frame.data):
-                    if self._activity.vad:
-                        if self._user_state != "speaking":
-                            f = rtc.AudioFrame(
-                                data=np.zeros(
-                                    f.samples_per_channel * f.num_channels,
-                                    dtype=np.int16,
-                                ).tobytes(),
-                                sample_rate=f.sample_rate,
-                                samples_per_channel=f.samples_per_channel,
-                                num_channels=f.num_channels,
-                            )
-                        elif prev_state != "speaking":
-                            # from silence to speaking
-                            while echo_audio_buffer.qsize() > 0:
-                                echo_audio_buffer.recv_nowait()
-                    prev_state = self._user_state
-                    try:
-                        echo_audio_buffer.send_nowait(f)
-                    except utils.aio.channel.ChanFull:
-                        logger.warning("Echo audio buffer is full")
-                        pass
-        finally:
-            if echo_audio_buffer:
-                echo_audio_buffer.close()
-            if echo_audio_atask:
-                echo_audio_atask.cancel()
+            audio_output = self.output.audio
+            if audio_output is None:
+                continue
+
+            # forward audio directly if in echo mode
+            if bstreamer is None:
+                samples_per_channel = frame.sample_rate // 100
+                bstreamer = _FastAudioByteStream(
+                    sample_rate=frame.sample_rate,
+                    num_channels=frame.num_channels,
+                    samples_per_channel=samples_per_channel,
+                )
+                silence = _silence_frame(
+                    frame.sample_rate, frame.num_channels, samples_per_channel
+                )
+
+            # the user state is read once per input frame; a change lands on
+            # the next frame, 10 ms later at most
+            silent = bool(activity.vad) and self._user_state != "speaking"
+            for f in bstreamer.push(frame.data):
+                if not silent:
+                    silent_frames = 0
+                elif silent_frames < self.echo_silence_tail:
+                    silent_frames += 1
+                    f = silence
+                else:
+                    continue
+                await audio_output.capture_frame(f)
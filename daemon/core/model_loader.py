@@ -1,29 +1,123 @@
 """Model loader for the bitHuman Visual Agent Application."""
 
 import asyncio
+import concurrent.futures
 import os
 import tempfile
-import threading
 import time
-from typing import Any, Literal, Optional
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from typing import Any, Literal, Optional, TypeVar
 
-import cv2
-import soundfile
+import numpy as np
 from livekit import rtc
 from livekit.agents import utils, vad
-from livekit.agents.voice.avatar import QueueAudioOutput
-from livekit.plugins import silero
+from livekit.agents.voice.avatar import AvatarOptions, QueueAudioOutput
 from loguru import logger
 
+from bithuman import AsyncBithuman
 from bithuman.utils.agent import LocalAvatarRunner
 from daemon.core.avatar import EchoAgent, EchoAgentSession, EchoLocalAudioIO
 from daemon.core.model_runtime import RuntimeManager
+from daemon.core.vad_loader import get_vad
 from daemon.core.voice_agent import VoiceAgent
 from daemon.utils import assets_manager
 from daemon.utils.helpers import safe_emit
-from daemon.utils.logging import LogCategory, debug, error, model as log_model, warning
+from daemon.utils.logging import (
+    LogCategory,
+    debug,
+    error,
+    is_enabled,
+    model as log_model,
+    warning,
+)
 from daemon.web_service import WebFrameStreamer
 
+# Optional faster JPEG encoder for cover photos, OpenCV is used otherwise
+try:
+    import simplejpeg
+except ImportError:
+    simplejpeg = None
+
+# Fallbacks used when settings.json defines no agent defaults
+DEFAULT_AGENT_INSTRUCTIONS = (
+    "Your name is Alice. You are an expert in dinosaurs. You educate people about "
+    "dinosaurs, their ecosystem, and their extinction."
+)
+DEFAULT_AGENT_VOICE = "alloy"
+
+# Number of encoded cover photos kept in memory
+COVER_PHOTO_CACHE_SIZE = 32
+
+T = TypeVar("T")
+
+
+def _encode_jpeg(
+    frame: np.ndarray, quality: int = 85, optimize: bool = True
+) -> bytes | None:
+    """Encode a frame as JPEG, preferring simplejpeg over OpenCV.
+
+    Args:
+        frame: Image of shape (height, width, 3) in the channel order
+            cv2.imwrite expects, as returned by the runtime's get_first_frame
+        quality: JPEG quality (0-100)
+        optimize: Whether OpenCV should compute optimized Huffman tables
+
+    Returns:
+        JPEG bytes or None if encoding failed
+    """
+    if simplejpeg is not None:
+        try:
+            return simplejpeg.encode_jpeg(
+                np.ascontiguousarray(frame),
+                quality=quality,
+                colorspace="BGR",
+                fastdct=True,
+            )
+        except Exception as e:
+            warning(
+                f"simplejpeg failed, falling back to OpenCV: {e}", LogCategory.MODEL
+            )
+
+    import cv2  # deferred: OpenCV is only needed for cover photos
+
+    # OpenCV rejects bools for these flags, so pass ints
+    params = [
+        int(cv2.IMWRITE_JPEG_QUALITY),
+        quality,
+        int(cv2.IMWRITE_JPEG_OPTIMIZE),
+        int(optimize),
+        int(cv2.IMWRITE_JPEG_PROGRESSIVE),
+        0,
+    ]
+    success, encoded = cv2.imencode(".jpg", frame, params)
+    return encoded.tobytes() if success else None
+
+
+def _model_file_key(model_path: str) -> tuple[str, float, int]:
+    """Identify a version of a model file by its path, mtime and size."""
+    stat = os.stat(model_path)
+    return model_path, stat.st_mtime, stat.st_size
+
+
+def _schedule(loop: asyncio.AbstractEventLoop, callback: Callable[[], Any]) -> None:
+    """Schedule a callback on the loop, skipping the thread wakeup when on it."""
+    try:
+        on_loop = asyncio.get_running_loop() is loop
+    except RuntimeError:
+        on_loop = False
+
+    if on_loop:
+        loop.call_soon(callback)
+    else:
+        loop.call_soon_threadsafe(callback)
+
+
+def _log_vad_warmup_failure(future: concurrent.futures.Future) -> None:
+    """Report a failed VAD warmup; get_vad() retries the load on first use."""
+    if not future.cancelled() and future.exception() is not None:
+        logger.opt(exception=future.exception()).warning("VAD warmup failed")
+
 
 class ModelLoader:
     """Handles loading and reloading of models."""
@@ -37,15 +131,16 @@ class ModelLoader:
         )
         self.current_local_audio: Optional[EchoLocalAudioIO] = None
         self.current_agent_session: Optional[EchoAgentSession] = None
-        self.vad: Optional[vad.VAD] = None
 
         self.reload_event = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        # Reload state is only mutated on the event loop (see _accept_reload)
         self.new_model_path: Optional[str] = None
         self.reload_requested: bool = False
-        # Add thread lock for synchronizing access to reload state
-        self.reload_lock = threading.RLock()
         # Add timestamp for tracking when reload was requested
         self.reload_requested_time = 0
+        # Called with get_status() whenever loading or readiness may change
+        self._state_callbacks: list[Callable[[dict[str, Any]], None]] = []
         # Store reference to Flask app when set
         self.flask_app = None
         # Store reference to SocketIO
@@ -54,17 +149,63 @@ class ModelLoader:
         self.is_muted = False
         self.current_mode: Literal["agent", "avatar"] = "agent"  # Default mode is agent
         self.current_sound_file = None  # Path to currently playing sound file
+        # (session, mode, ...) the session's current agent was built for
+        self._last_agent_key: tuple | None = None
+        # Name reported by get_status, set when a runtime is created
+        self._current_model_name: str = "unknown"
+        # LRU of JPEG covers keyed by (model_path, mtime, size, quality, optimize)
+        self._cover_photo_cache: OrderedDict[
+            tuple[str, float, int, int, bool], bytes
+        ] = OrderedDict()
+        # First frame (width, height) keyed by (model_path, mtime, size)
+        self._frame_sizes: dict[tuple[str, float, int], tuple[int, int]] = {}
         self._active = True
 
+        self._vad_warmup: concurrent.futures.Future | None = None
+        try:
+            # The loop that owns the runtimes, see run_coroutine
+            self._loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # no running loop yet; the VAD is loaded on first use
+        # Only the echo agent needs the VAD, agent mode never loads it
+        if self.current_mode == "avatar":
+            self._warm_up_vad()
+
+    def run_coroutine(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run a coroutine on the daemon's event loop and wait for the result.
+
+        For callers on other threads such as Flask request handlers. Runtimes
+        and their pending loads belong to the daemon loop, so they must not be
+        touched from a loop of the caller's own.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            The coroutine's result
+        """
+        if self._loop is None or not self._loop.is_running():
+            # No daemon loop (e.g. a standalone loader), nothing to share
+            return asyncio.run(coro)
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def _warm_up_vad(self) -> None:
+        """Start loading the shared VAD in a worker thread, once.
+
+        Keeps ONNX session creation off the event loop ahead of the first
+        echo agent. Safe to call from any thread.
+        """
+        if self._vad_warmup is not None:
+            return
+        if self._loop is None or not self._loop.is_running():
+            return  # get_vad() loads it on first use instead
+        self._vad_warmup = asyncio.run_coroutine_threadsafe(
+            asyncio.to_thread(get_vad), self._loop
+        )
+        self._vad_warmup.add_done_callback(_log_vad_warmup_failure)
+
     def _get_vad(self) -> vad.VAD:
-        if self.vad is None:
-            self.vad = silero.VAD.load(
-                min_speech_duration=0.05,
-                min_silence_duration=2,
-                activation_threshold=0.1,
-                sample_rate=8000,
-            )
-        return self.vad
+        return get_vad()
 
     def set_mode(
         self, mode: Literal["agent", "avatar"], force_update: bool = False
@@ -91,27 +232,40 @@ class ModelLoader:
 
         logger.info(f"Mode set to: {mode}")
 
+        if mode == "avatar":
+            self._warm_up_vad()
+
         if not self.current_agent_session or not self.current_visual_agent_runner:
             return False
 
+        # A forced update with an unchanged configuration (e.g. a retried
+        # session start) keeps the agent the session already has
+        session = self.current_agent_session
         if self.current_mode == "agent":
             instructions, voice = self._get_agent_instructions_and_voice()
-            agent = VoiceAgent(instructions=instructions, voice=voice)
+            agent_key = (session, mode, instructions, voice)
         else:
-            agent = EchoAgent(vad=self._get_vad())
+            agent_key = (session, mode)
 
-        # update agent
-        loop = self.current_agent_session._loop
-        if self.current_agent_session._activity:
+        if agent_key != self._last_agent_key:
+            if self.current_mode == "agent":
+                agent = VoiceAgent(instructions=instructions, voice=voice)
+            else:
+                agent = EchoAgent(vad=self._get_vad())
 
-            def interrupt_and_update_agent():
-                self.current_agent_session.interrupt()
-                self.current_agent_session.update_agent(agent)
-                self.current_agent_session.output.audio.clear_buffer()
+            # update agent
+            loop = session._loop
+            if session._activity:
 
-            loop.call_soon_threadsafe(interrupt_and_update_agent)
-        else:
-            self.current_agent_session._agent = agent
+                def interrupt_and_update_agent():
+                    session.interrupt()
+                    session.update_agent(agent)
+                    session.output.audio.clear_buffer()
+
+                _schedule(loop, interrupt_and_update_agent)
+            else:
+                session._agent = agent
+            self._last_agent_key = agent_key
 
         # update idle timeout parameter for runtime
         self.current_visual_agent_runner._bithuman_runtime.set_idle_timeout(
@@ -145,24 +299,66 @@ class ModelLoader:
 
         # Log the action
         logger.info(f"Playing sound file: {file_path}")
-        audio, sr = soundfile.read(file_path, dtype="int16", always_2d=True)
-        audio = audio.T  # (channels, samples)
-        audio_frame = rtc.AudioFrame(
-            data=audio.tobytes(),
-            sample_rate=sr,
-            num_channels=audio.shape[0],
-            samples_per_channel=audio.shape[1],
-        )
+        # Imported on first use to keep libsndfile out of daemon startup
+        import soundfile
+
+        # Probe the file here so unreadable files are reported to the caller; it
+        # is opened inside the generator, which closes it however playback ends
+        try:
+            info = soundfile.info(file_path)
+        except Exception as e:
+            logger.error(f"Failed to open sound file {file_path}: {e}")
+            return False
 
         async def audio_generator():
-            yield audio_frame
+            # Stream in 20 ms blocks instead of decoding the file at once
+            sr = info.samplerate
+            # One read buffer per playback; AudioFrame copies the samples out
+            buf = np.empty((sr // 50, info.channels), dtype=np.int16)
+            # Float files (e.g. cached TTS output) are read as float32 and
+            # scaled to int16 with vectorized NumPy ops
+            fbuf = (
+                np.empty(buf.shape, dtype=np.float32)
+                if info.subtype in ("FLOAT", "DOUBLE")
+                else None
+            )
+
+            def read_block() -> np.ndarray:
+                if fbuf is None:
+                    return sound.read(len(buf), dtype="int16", always_2d=True, out=buf)
+                samples = sound.read(
+                    len(fbuf), dtype="float32", always_2d=True, out=fbuf
+                )
+                np.multiply(samples, 32767.0, out=samples)
+                np.clip(samples, -32768.0, 32767.0, out=samples)
+                block = buf[: len(samples)]
+                np.copyto(block, samples, casting="unsafe")
+                return block
+
+            # No await between opening and the try, so the finally always closes it
+            sound = soundfile.SoundFile(file_path)
+            try:
+                while True:
+                    # Decode in a worker thread so file I/O never stalls the loop
+                    block = await asyncio.to_thread(read_block)
+                    if not len(block):
+                        break
+                    # (samples, channels) is the interleaved layout AudioFrame expects
+                    yield rtc.AudioFrame(
+                        data=memoryview(block).cast("B"),
+                        sample_rate=sr,
+                        num_channels=block.shape[1],
+                        samples_per_channel=block.shape[0],
+                    )
+            finally:
+                sound.close()
 
         def interrupt_and_say():
             self.current_agent_session.interrupt()
             self.current_agent_session.say(text="", audio=audio_generator())
 
         loop = self.current_agent_session._loop
-        loop.call_soon_threadsafe(interrupt_and_say)
+        _schedule(loop, interrupt_and_say)
 
         return True
 
@@ -183,6 +379,29 @@ class ModelLoader:
 
         return self.is_muted
 
+    def on_state_change(self, callback: Callable[[dict[str, Any]], None]) -> None:
+        """Register a callback for model loading and readiness changes.
+
+        The callback receives get_status() and runs on the event loop. It may be
+        called again without an actual change, so it should compare states.
+
+        Args:
+            callback: Function taking the status dictionary
+        """
+        self._state_callbacks.append(callback)
+
+    def _notify_state_change(self) -> None:
+        """Pass the current status to every registered state callback."""
+        if not self._state_callbacks:
+            return
+
+        status = self.get_status()
+        for callback in self._state_callbacks:
+            try:
+                callback(status)
+            except Exception as e:
+                error(f"Error in state change callback: {e}", LogCategory.MODEL)
+
     def set_flask_app(self, app, socketio):
         """Set the Flask app and SocketIO references.
 
@@ -213,7 +432,12 @@ class ModelLoader:
             with self.flask_app.app_context():
                 # Use safe_emit to handle Werkzeug errors
                 safe_emit(self.socketio, event_name, data)
-                log_model(f"Emitted {event_name} event with data: {data}")
+                # Formatting the payload is skipped unless debug output is on
+                if is_enabled("DEBUG", LogCategory.MODEL):
+                    log_model(
+                        f"Emitted {event_name} event with data: {data}",
+                        level="DEBUG",
+                    )
         except Exception as e:
             warning(
                 f"Error emitting SocketIO event {event_name}: {e}", LogCategory.MODEL
@@ -232,23 +456,30 @@ class ModelLoader:
             error(f"Error loading user settings: {e}", LogCategory.MODEL)
             return {}
 
-    def _get_agent_instructions_and_voice(self) -> tuple[str, str]:
+    def _get_agent_instructions_and_voice(
+        self, settings: dict[str, Any] | None = None
+    ) -> tuple[str, str]:
         """Get agent instructions and voice from user settings or defaults.
 
+        Args:
+            settings: Already loaded user settings, read from disk if omitted
+
         Returns:
             Tuple of (instructions, voice)
         """
-        settings = self._load_user_settings()
+        if settings is None:
+            settings = self._load_user_settings()
 
         # Get instructions from settings.prompt or use default
         default_instructions = assets_manager.get_setting(
-            "agent.defaultInstructions",
-            "Your name is Alice. You are an expert in dinosaurs. You educate people about dinosaurs, their ecosystem, and their extinction.",
+            "agent.defaultInstructions", DEFAULT_AGENT_INSTRUCTIONS, settings
         )
         instructions = settings.get("prompt", "") or default_instructions
 
         # Get voice from settings.voice or use default
-        default_voice = assets_manager.get_setting("defaults.voice", "alloy")
+        default_voice = assets_manager.get_setting(
+            "defaults.voice", DEFAULT_AGENT_VOICE, settings
+        )
         voice = settings.get("voice", "") or default_voice
 
         log_model(f"Using agent instructions: {instructions[:50]}... (truncated)")
@@ -256,6 +487,54 @@ class ModelLoader:
 
         return instructions, voice
 
+    async def _prepare_runtime(
+        self, model_path: str, api_secret: str | None
+    ) -> tuple[AsyncBithuman, AvatarOptions]:
+        """Create a runtime for the model and the matching avatar options.
+
+        Args:
+            model_path: Path to the model file
+            api_secret: API secret for the bitHuman runtime
+
+        Returns:
+            Tuple of (runtime, visual_agent_options)
+        """
+        # Create runtime with the model
+        log_model(f"Creating runtime with model: {model_path}")
+
+        # Check if the file exists, the same stat identifies its version
+        try:
+            size_key = _model_file_key(model_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(
+                f"Visual Agent model file not found at: {model_path}"
+            ) from None
+
+        runtime = await self.runtime_manager.create_runtime(model_path, api_secret)
+        self._current_model_name = os.path.basename(model_path)
+        frame_size = self._frame_sizes.get(size_key)
+        if frame_size is not None:
+            # Known from an earlier load or cover photo, skip the first frame
+            width, height = frame_size
+            visual_agent_options = (
+                self.runtime_manager.create_visual_agent_options_from_shape(
+                    height, width
+                )
+            )
+        else:
+            first_frame = runtime.get_first_frame()
+            visual_agent_options = self.runtime_manager.create_visual_agent_options(
+                first_frame
+            )
+            self._frame_sizes[size_key] = (
+                visual_agent_options.video_width,
+                visual_agent_options.video_height,
+            )
+        width = visual_agent_options.video_width
+        height = visual_agent_options.video_height
+        log_model(f"Runtime created with dimensions: {width}x{height}")
+        return runtime, visual_agent_options
+
     async def _load_model(
         self,
         model_path: str,
@@ -278,6 +557,9 @@ class ModelLoader:
             action = "Initializing" if is_initial_load else "Reloading"
             log_model(f"{action} model: {model_path}")
 
+            # Read settings.json once for the whole load
+            settings = self._load_user_settings()
+
             # Resolve default model if none provided
             if not model_path:
                 # Use settings utils to get the user data directory and default model
@@ -300,7 +582,9 @@ class ModelLoader:
 
             # Get API secret from settings if not provided
             if not api_secret:
-                api_secret = assets_manager.get_api_key("bithuman")
+                api_secret = assets_manager.get_setting(
+                    "apiKeys.bithuman", "", settings
+                )
 
             # Notify clients if requested
             if notify_ui:
@@ -308,56 +592,60 @@ class ModelLoader:
                     "reload-started", {"model": os.path.basename(model_path)}
                 )
 
+            # Closing the current runner below stops its runtime, so a reload
+            # of the same model must not get that runtime back from the cache
+            if not is_initial_load and self.current_visual_agent_runner:
+                current_runtime = self.runtime_manager.current_runtime
+                if current_runtime is not None:
+                    self.runtime_manager.retire(current_runtime)
+
+            # Load the new runtime while the current one keeps streaming, so
+            # the visible stall is only the teardown and swap below
+            runtime, visual_agent_options = await self._prepare_runtime(
+                model_path, api_secret
+            )
+
             # Stop current components if they exist and this is a reload
             if not is_initial_load:
+                # The runner and the OpenAI connection are independent, so
+                # tear them down concurrently
+                closing = []
+                names = []
+
                 # Stop current visual agent runner if it exists
                 if self.current_visual_agent_runner:
                     log_model("Stopping current visual agent runner...")
-                    await self.current_visual_agent_runner.aclose()
-                    log_model("Current visual agent runner stopped")
+                    closing.append(self.current_visual_agent_runner.aclose())
+                    names.append("visual agent runner")
 
                 # Clean up OpenAI connection if it exists
                 if self.current_local_audio and hasattr(
                     self.current_local_audio, "_agent"
                 ):
                     log_model("Cleaning up OpenAI connection...")
-                    try:
-                        await self.current_local_audio._agent.aclose()
-                    except Exception as e:
+                    closing.append(self.current_local_audio._agent.aclose())
+                    names.append("OpenAI connection")
+
+                results = await asyncio.gather(*closing, return_exceptions=True)
+                for name, result in zip(names, results, strict=True):
+                    if isinstance(result, Exception):
                         warning(
-                            f"Error cleaning up OpenAI connection: {e}",
-                            LogCategory.MODEL,
+                            f"Error cleaning up {name}: {result}", LogCategory.MODEL
                         )
-
-            # Create runtime with the model
-            log_model(f"Creating runtime with model: {model_path}")
-
-            # Check if the file exists
-            if not os.path.exists(model_path):
-                raise FileNotFoundError(
-                    f"Visual Agent model file not found at: {model_path}"
-                )
-
-            runtime = await self.runtime_manager.create_runtime(model_path, api_secret)
-            first_frame = runtime.get_first_frame()
-            visual_agent_options = self.runtime_manager.create_visual_agent_options(
-                first_frame
-            )
-            log_model(
-                f"Runtime created with dimensions: {visual_agent_options.video_width}x{visual_agent_options.video_height}"
-            )
+                    else:
+                        log_model(f"Current {name} stopped")
 
             # Create WebVideoPlayer during initial load only
             if is_initial_load:
                 log_model("Creating frame streamer")
                 self.current_video_player = WebFrameStreamer(
                     window_title=assets_manager.get_setting(
-                        "ui.windowTitle", "bitHuman Visual Agent"
+                        "ui.windowTitle", "bitHuman Visual Agent", settings
                     ),
-                    quality=assets_manager.get_setting("ui.quality", 85),
-                    max_fps=assets_manager.get_setting("ui.fpsLimit", 30),
+                    quality=assets_manager.get_setting("ui.quality", 85, settings),
+                    max_fps=assets_manager.get_setting("ui.fpsLimit", 30, settings),
                     auto_open_browser=assets_manager.get_setting(
-                        "ui.autoOpenBrowser", False
+                        "ui.autoOpenBrowser", False, settings
                     ),
                 )
                 self.current_video_player.start()
@@ -370,7 +658,7 @@ class ModelLoader:
             )
             self.current_agent_session = EchoAgentSession()
             self.current_agent_session.output.audio = interim_audio_buffer
-            buffer_size = assets_manager.get_setting("audio.bufferSize", 3)
+            buffer_size = assets_manager.get_setting("audio.bufferSize", 3, settings)
             self.current_local_audio = EchoLocalAudioIO(
                 session=self.current_agent_session,
                 agent_audio_output=interim_audio_buffer,
@@ -409,15 +697,10 @@ class ModelLoader:
                         # If already initialized, this will raise an exception - we can ignore it
                         pass
 
-                    # Get instructions and voice from user settings or defaults
-                    instructions, voice = self._get_agent_instructions_and_voice()
-                    if not is_initial_load:
-                        log_model(
-                            f"Using refreshed agent instructions: {instructions[:50]}... (truncated)"
-                        )
-                        log_model(f"Using refreshed voice: {voice}")
-
-                    # Start the agent session
+                    # Start the agent session; make sure the VAD the echo agent
+                    # needs is loaded without blocking the event loop first
+                    if self.current_mode == "avatar":
+                        await asyncio.to_thread(get_vad)
                     self.set_mode(mode=self.current_mode, force_update=True)
                     await self.current_agent_session.start(
                         agent=self.current_agent_session.current_agent
@@ -458,11 +741,8 @@ class ModelLoader:
             return False, "Unexpected error - reached end of loading function", None
 
         except Exception as e:
-            import traceback
-
-            traceback.print_exc()
             error_msg = f"Error {action.lower()} model: {e}"
-            error(error_msg, LogCategory.MODEL)
+            error(error_msg, LogCategory.MODEL, exc_info=True)
 
             # Notify UI of failure if requested
             if notify_ui:
@@ -495,6 +775,7 @@ class ModelLoader:
             is_initial_load=True,
             notify_ui=False,
         )
+        self._notify_state_change()
         return success, error_msg
 
     async def reload_model(self, model_path: Optional[str] = None) -> bool:
@@ -524,10 +805,10 @@ class ModelLoader:
         )
 
         # Reset reload flags
-        with self.reload_lock:
-            self.reload_requested = False
-            self.new_model_path = None
-            self.reload_requested_time = 0
+        self.reload_requested = False
+        self.new_model_path = None
+        self.reload_requested_time = 0
+        self._notify_state_change()
 
         return success
 
@@ -538,64 +819,58 @@ class ModelLoader:
             stop_event: Event to signal when to stop monitoring
         """
         log_model("Starting reload event handler")
+        # request_reload runs on Flask threads and wakes us through this loop
+        self._loop = asyncio.get_running_loop()
 
-        while not stop_event.is_set():
-            try:
-                # Check for reload event
-                if self.reload_event.is_set():
+        stop_task = asyncio.ensure_future(stop_event.wait())
+        try:
+            while not stop_event.is_set():
+                reload_task = asyncio.ensure_future(self.reload_event.wait())
+                await asyncio.wait(
+                    {reload_task, stop_task}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if stop_event.is_set():
+                    reload_task.cancel()
+                    break
+
+                try:
+                    # Handle the request right away; requests arriving while
+                    # the reload runs set the event again and the latest path
+                    # wins on the next pass
                     self.reload_event.clear()
-                    current_new_model_path = None
 
-                    with self.reload_lock:
-                        if self.new_model_path:
-                            # Store the path locally before we might reset it
-                            current_new_model_path = self.new_model_path
+                    current_new_model_path = self.new_model_path
+
+                    if not current_new_model_path:
+                        continue
+
+                    log_model(
+                        f"Processing reload request for model: {current_new_model_path}"
+                    )
+                    try:
+                        success = await self.reload_model(current_new_model_path)
+                        if success:
+                            log_model("Model reload completed successfully")
+                        else:
+                            warning("Model reload failed", LogCategory.MODEL)
+                    except Exception as e:
+                        error(f"Error during model reload: {e}", LogCategory.MODEL)
 
-                    if current_new_model_path:
-                        log_model(
-                            f"Processing reload request for model: {current_new_model_path}"
+                        # Notify UI
+                        self._emit_socketio_event(
+                            "reload-error",
+                            {"message": f"Error reloading model: {str(e)}"},
                         )
-                        try:
-                            success = await self.reload_model(current_new_model_path)
-                            if success:
-                                log_model("Model reload completed successfully")
-                            else:
-                                warning("Model reload failed", LogCategory.MODEL)
-                        except Exception as e:
-                            error(f"Error during model reload: {e}", LogCategory.MODEL)
-
-                            # Notify UI
-                            self._emit_socketio_event(
-                                "reload-error",
-                                {"message": f"Error reloading model: {str(e)}"},
-                            )
-
-                # Check for polling-based reload request if using background polling mode
-                with self.reload_lock:
-                    if self.reload_requested and not self.reload_event.is_set():
-                        # Get elapsed time since request
-                        elapsed = time.time() - self.reload_requested_time
-
-                        # Only proceed with reload if we've waited at least 0.5 seconds
-                        # This helps debounce multiple rapid reload requests
-                        if elapsed >= 0.5:
-                            log_model(
-                                f"Detected pending reload request for {self.new_model_path}"
-                            )
-                            self.reload_event.set()  # Trigger reload on next iteration
-
-                # Small delay to prevent busy waiting
-                await asyncio.sleep(0.1)
-
-            except asyncio.CancelledError:
-                # Gracefully exit if the task is cancelled
-                log_model("Reload event handler cancelled")
-                break
-            except Exception as e:
-                error(f"Error in reload event handler: {e}", LogCategory.MODEL)
+                except Exception as e:
+                    error(f"Error in reload event handler: {e}", LogCategory.MODEL)
 
-                # Add a delay after an error to prevent rapid error loops
-                await asyncio.sleep(1.0)
+                    # Add a delay after an error to prevent rapid error loops
+                    await asyncio.sleep(1.0)
+        except asyncio.CancelledError:
+            # Gracefully exit if the task is cancelled
+            log_model("Reload event handler cancelled")
+        finally:
+            stop_task.cancel()
 
     def get_status(self) -> dict[str, Any]:
         """Get the current status of the model loader.
@@ -604,34 +879,30 @@ class ModelLoader:
             Dictionary containing current status
         """
         try:
-            with self.reload_lock:  # Use lock to ensure consistent state
-                is_reloading = self.reload_requested or self.reload_event.is_set()
+            is_reloading = self.reload_requested or self.reload_event.is_set()
 
-                # Check if we have a valid model loaded
-                model_ready = (
-                    self.runtime_manager.current_runtime is not None
-                    and self.current_visual_agent_runner is not None
-                )
+            # Check if we have a valid model loaded
+            model_ready = (
+                self.runtime_manager.current_runtime is not None
+                and self.current_visual_agent_runner is not None
+            )
+
+            # Get current model path; the name is cached when the model loads
+            model_path = self.runtime_manager.current_model_path or "unknown"
+            model_name = self._current_model_name
 
-                # Get current model path
-                model_path = self.runtime_manager.current_model_path or "unknown"
-                if model_path and os.path.exists(model_path):
-                    model_name = os.path.basename(model_path)
-                else:
-                    model_name = "unknown"
-
-                # Get mute state if available
-                return {
-                    "is_ready": model_ready and not is_reloading,
-                    "is_reloading": is_reloading,
-                    "is_muted": self.is_muted,
-                    "current_mode": self.current_mode,
-                    "current_sound_file": self.current_sound_file,
-                    "model_path": model_path,
-                    "model_name": model_name,
-                    "reload_requested": self.reload_requested,
-                    "reload_time": self.reload_requested_time,
-                }
+            # Get mute state if available
+            return {
+                "is_ready": model_ready and not is_reloading,
+                "is_reloading": is_reloading,
+                "is_muted": self.is_muted,
+                "current_mode": self.current_mode,
+                "current_sound_file": self.current_sound_file,
+                "model_path": model_path,
+                "model_name": model_name,
+                "reload_requested": self.reload_requested,
+                "reload_time": self.reload_requested_time,
+            }
 
         except Exception as e:
             error(f"Error getting status: {e}", LogCategory.MODEL)
@@ -641,11 +912,24 @@ class ModelLoader:
                 "is_muted": False,
                 "current_mode": self.current_mode,
                 "current_sound_file": self.current_sound_file,
-                "model_path": model_path,
-                "model_name": model_name,
+                "model_path": self.runtime_manager.current_model_path or "unknown",
+                "model_name": self._current_model_name,
                 "error": str(e),
             }
 
+    def _accept_reload(self, model_path: str) -> None:
+        """Record a reload request and wake the reload handler.
+
+        Runs on the event loop, which is the only place the reload state is
+        mutated, so no lock is needed around it.
+        """
+        log_model(f"Setting new model path: {model_path}")
+        self.new_model_path = model_path
+        self.reload_requested = True
+        self.reload_requested_time = time.time()
+        self.reload_event.set()
+        self._notify_state_change()
+
     def request_reload(self, model_path: str, force_reload: bool = False) -> bool:
         """Request a model reload.
 
@@ -657,37 +941,32 @@ class ModelLoader:
             True if request was accepted, False otherwise
         """
         try:
-            with self.reload_lock:
-                # Check if model is already loaded and we're not forcing a reload
-                if (
-                    not force_reload
-                    and self.runtime_manager.current_model_path == model_path
-                ):
-                    # Only update the current model path if it's different
-                    log_model(
-                        f"Current model: {self.runtime_manager.current_model_path}"
+            # Check if model is already loaded and we're not forcing a reload
+            if (
+                not force_reload
+                and self.runtime_manager.current_model_path == model_path
+            ):
+                # Only update the current model path if it's different
+                log_model(f"Current model: {self.runtime_manager.current_model_path}")
+
+                if self.reload_requested:
+                    warning(
+                        "Reload already in progress, ignoring duplicate request",
+                        LogCategory.MODEL,
                     )
+                    return False
 
-                    if self.reload_requested:
-                        warning(
-                            "Reload already in progress, ignoring duplicate request",
-                            LogCategory.MODEL,
-                        )
-                        return False
-
-                    log_model("Model already loaded, not reloading")
-                    return True
-
-                # Set new model path
-                log_model(f"Setting new model path: {model_path}")
-                self.new_model_path = model_path
-                self.reload_requested = True
-                self.reload_requested_time = time.time()
+                log_model("Model already loaded, not reloading")
+                return True
 
-                # Signal reload
-                self.reload_event.set()
+            # Called from Flask threads: hand the request to the loop running
+            # the reload handler
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._accept_reload, model_path)
+            else:
+                self._accept_reload(model_path)
 
-                return True
+            return True
 
         except Exception as e:
             error(f"Error requesting reload: {e}", LogCategory.MODEL)
@@ -696,97 +975,199 @@ class ModelLoader:
     async def cleanup(self) -> None:
         """Clean up resources."""
         try:
-            # Stop the current visual agent runner
-            if self.current_visual_agent_runner:
-                self.current_visual_agent_runner.stop()
-                await self.current_visual_agent_runner.aclose()
+            runner = self.current_visual_agent_runner
+            local_audio = self.current_local_audio
+            # The audio IO's _agent is this session, so it is closed only once
+            agent_session = self.current_agent_session or getattr(
+                local_audio, "_agent", None
+            )
 
-            # Clean up audio resources
-            if self.current_local_audio:
-                await self.current_local_audio.aclose()
+            async def close_agent_audio() -> None:
+                # Stop the agent (and its OpenAI connection) before the audio
+                # IO that feeds it
+                if agent_session:
+                    try:
+                        await agent_session.aclose()
+                    except Exception as e:
+                        warning(
+                            f"Error cleaning up OpenAI connection: {e}",
+                            LogCategory.MODEL,
+                        )
+                if local_audio:
+                    await local_audio.aclose()
 
-            # Clean up OpenAI connection if it exists
-            if self.current_local_audio and hasattr(self.current_local_audio, "_agent"):
-                try:
-                    await self.current_local_audio._agent.aclose()
-                except Exception as e:
-                    warning(
-                        f"Error cleaning up OpenAI connection: {e}", LogCategory.MODEL
-                    )
+            # Stop the current visual agent runner
+            closing = [close_agent_audio()]
+            if runner:
+                runner.stop()
+                closing.append(runner.aclose())
 
-            if self.current_agent_session:
-                await self.current_agent_session.aclose()
-                self.current_agent_session = None
+            # The runner is independent of the agent, so shut both down together
+            for result in await asyncio.gather(*closing, return_exceptions=True):
+                if isinstance(result, Exception):
+                    warning(f"Error during cleanup: {result}", LogCategory.MODEL)
 
             # Reset instance variables
             self.current_visual_agent_runner = None
             self.current_local_audio = None
+            self.current_agent_session = None
+            self._last_agent_key = None
             self.new_model_path = None
             self.reload_requested = False
             self._active = False
+            self._notify_state_change()
         except Exception as e:
             error(f"Error during cleanup: {e}", LogCategory.MODEL)
 
-    async def get_cover_photo_from_model(self, model_path: str) -> Optional[str]:
-        """Get the first frame of the model and save it as a cover photo in a temporary directory.
+    async def get_cover_photo_bytes(
+        self, model_path: str, quality: int = 85, optimize: bool = True
+    ) -> bytes | None:
+        """Get the first frame of the model as JPEG bytes.
 
         Args:
             model_path: Path to the model file
+            quality: JPEG quality (0-100)
+            optimize: Whether to optimize the JPEG Huffman tables
 
         Returns:
-            Path to the temporary cover photo or None if failed
+            JPEG bytes of the cover photo or None if failed
         """
         try:
             log_model(f"Getting cover photo for model: {model_path}")
 
-            # Get API secret for model loading
-            api_secret = assets_manager.get_api_key("bithuman")
-            log_model(f"Using API secret: {api_secret[:5]}... (truncated)")
+            # Covers are cached per model file version, so repeated requests
+            # neither load a runtime nor re-encode the frame
+            size_key = _model_file_key(model_path)
+            cache_key = (*size_key, quality, optimize)
+            jpeg_bytes = self._cover_photo_cache.get(cache_key)
+            if jpeg_bytes is None:
+                jpeg_bytes = await self._encode_cover_photo(
+                    model_path, quality, optimize, size_key
+                )
+                if jpeg_bytes is None:
+                    return None
+                self._cover_photo_cache[cache_key] = jpeg_bytes
+                if len(self._cover_photo_cache) > COVER_PHOTO_CACHE_SIZE:
+                    self._cover_photo_cache.popitem(last=False)
+            else:
+                self._cover_photo_cache.move_to_end(cache_key)
+                log_model("Using cached cover photo")
+
+            return jpeg_bytes
+        except Exception as e:
+            # The stack trace is only rendered if the record is emitted
+            error(f"Error getting cover photo: {e}", LogCategory.MODEL, exc_info=True)
+            return None
 
-            # Create runtime with the model
-            log_model(f"Creating runtime with model: {model_path}")
-            runtime = await self.runtime_manager.create_runtime(
-                model_path, api_secret=api_secret
-            )
-            log_model("Runtime created successfully")
+    async def get_cover_photo_from_model(
+        self, model_path: str, quality: int = 85, optimize: bool = True
+    ) -> str | None:
+        """Get the first frame of the model and save it as a cover photo in a temporary directory.
 
-            # Get the first frame
-            log_model("Getting first frame from model")
-            first_frame = runtime.get_first_frame()
-            if first_frame is None:
-                error("Failed to get first frame from model", LogCategory.MODEL)
-                return None
-            log_model("Successfully retrieved first frame from model")
+        Only for callers that need a file path; use get_cover_photo_bytes when
+        the image data itself is enough.
 
-            # Get dimensions from the frame
-            visual_agent_options = self.runtime_manager.create_visual_agent_options(
-                first_frame
-            )
-            log_model(
-                f"Cover photo dimensions: {visual_agent_options.video_width}x{visual_agent_options.video_height}"
-            )
+        Args:
+            model_path: Path to the model file
+            quality: JPEG quality (0-100)
+            optimize: Whether to optimize the JPEG Huffman tables
 
+        Returns:
+            Path to the temporary cover photo or None if failed
+        """
+        jpeg_bytes = await self.get_cover_photo_bytes(model_path, quality, optimize)
+        if jpeg_bytes is None:
+            return None
+
+        try:
             # Generate output filename from the model name
             model_name = os.path.basename(model_path)
             model_name_without_ext = os.path.splitext(model_name)[0]
 
-            # Create a temporary file with the right extension
-            temp_file = tempfile.NamedTemporaryFile(
-                suffix=f"_{model_name_without_ext}.jpg", delete=False
+            # Save the image to a temporary file (honors TMPDIR) with the right
+            # extension
+            fd, cover_photo_path = tempfile.mkstemp(
+                suffix=f"_{model_name_without_ext}.jpg"
             )
-            temp_file.close()
-            cover_photo_path = temp_file.name
-
-            # Save the image to the temporary file
-            log_model(f"Saving cover photo to: {cover_photo_path}")
-            cv2.imwrite(cover_photo_path, first_frame)
+            try:
+                # Hand the encoded image to the kernel directly, no file object
+                with memoryview(jpeg_bytes) as view:
+                    while view:
+                        view = view[os.write(fd, view) :]
+            finally:
+                os.close(fd)
             log_model(f"Cover photo saved to temporary location: {cover_photo_path}")
 
             return cover_photo_path
         except Exception as e:
-            error(f"Error getting cover photo: {e}", LogCategory.MODEL)
-            # Print full stack trace to help with debugging
-            import traceback
+            error(f"Error saving cover photo: {e}", LogCategory.MODEL)
+            return None
+
+    async def _encode_cover_photo(
+        self,
+        model_path: str,
+        quality: int,
+        optimize: bool,
+        size_key: tuple[str, float, int],
+    ) -> bytes | None:
+        """Encode the first frame of a model as JPEG.
+
+        Args:
+            model_path: Path to the model file
+            quality: JPEG quality (0-100)
+            optimize: Whether to optimize the JPEG Huffman tables
+            size_key: Model file key the frame size is remembered under
 
-            error(f"Stack trace: {traceback.format_exc()}", LogCategory.MODEL)
+        Returns:
+            JPEG bytes or None if failed
+        """
+        borrowed = (
+            self.runtime_manager.current_model_path == model_path
+            and self.runtime_manager.current_runtime is not None
+        )
+        if borrowed:
+            # The model is already loaded, no need for a second runtime
+            log_model("Using the loaded runtime for the cover photo")
+            runtime = self.runtime_manager.current_runtime
+        else:
+            # Get API secret for model loading
+            api_secret = assets_manager.get_api_key("bithuman")
+            log_model(f"Using API secret: {api_secret[:5]}... (truncated)")
+
+            # Create runtime with the model
+            log_model(f"Creating runtime with model: {model_path}")
+            runtime = await self.runtime_manager.create_runtime(
+                model_path, api_secret=api_secret, set_current=False
+            )
+            log_model("Runtime created successfully")
+
+        # Get the first frame
+        log_model("Getting first frame from model")
+        try:
+            first_frame = runtime.get_first_frame()
+        finally:
+            # A whole model stays in memory while its runtime is cached, and a
+            # cover photo only needs the first frame
+            if not borrowed:
+                await self.runtime_manager.evict(model_path)
+
+        if first_frame is None:
+            error("Failed to get first frame from model", LogCategory.MODEL)
             return None
+        log_model("Successfully retrieved first frame from model")
+
+        # Get dimensions from the frame
+        visual_agent_options = self.runtime_manager.create_visual_agent_options(
+            first_frame
+        )
+        self._frame_sizes[size_key] = (
+            visual_agent_options.video_width,
+            visual_agent_options.video_height,
+        )
+        width, height = self._frame_sizes[size_key]
+        log_model(f"Cover photo dimensions: {width}x{height}")
+
+        jpeg_bytes = _encode_jpeg(first_frame, quality, optimize)
+        if jpeg_bytes is None:
+            error("Failed to encode cover photo", LogCategory.MODEL)
+        return jpeg_bytes
@@ -1,7 +1,10 @@
 """Model runtime management for the bitHuman Visual Agent Application."""
 
+import asyncio
 import os
-from typing import Optional
+import re
+import weakref
+from collections import OrderedDict
 
 import numpy as np
 from livekit.agents.voice.avatar import AvatarOptions
@@ -10,26 +13,54 @@ from loguru import logger
 from bithuman import AsyncBithuman
 from daemon.utils import assets_manager
 
+# Number of runtimes kept loaded for reuse. The current runtime and the one
+# just loaded are never released, so this is a single warm slot that carries a
+# warmed-up runtime over to the first load
+RUNTIME_CACHE_SIZE = 1
+
+# Hints used to explain runtime initialization failures
+_AUTH_RE = re.compile(r"api[_ ]key|auth", re.IGNORECASE)
+_NET_RE = re.compile(r"timeout|connect|network", re.IGNORECASE)
+
+# (model_path, api_secret, mtime, size) identifying a loaded runtime
+RuntimeKey = tuple[str, str, float, int]
+
 
 class RuntimeManager:
-    """Manages the bitHuman runtime."""
+    """Manages the bitHuman runtime.
+
+    Not thread-safe: the cache and pending loads belong to one event loop, so
+    callers on other threads go through ModelLoader.run_coroutine.
+    """
 
     def __init__(self):
         """Initialize the RuntimeManager."""
-        self.current_runtime: Optional[AsyncBithuman] = None
-        self.current_model_path: Optional[str] = None
+        self.current_runtime: AsyncBithuman | None = None
+        self.current_model_path: str | None = None
+        # Loaded runtimes by (model_path, api_secret, mtime, size), least
+        # recently used first, so a replaced model file is loaded again
+        self._runtimes: OrderedDict[RuntimeKey, AsyncBithuman] = OrderedDict()
+        # Runtimes still being created, so concurrent requests share one load
+        self._pending: dict[RuntimeKey, asyncio.Task] = {}
+        # Runtimes that were or are about to be stopped and must not be reused
+        self._retired: weakref.WeakSet[AsyncBithuman] = weakref.WeakSet()
 
     async def create_runtime(
-        self, model_path: str, api_secret: Optional[str] = None
+        self,
+        model_path: str,
+        api_secret: str | None = None,
+        set_current: bool = True,
     ) -> AsyncBithuman:
         """Initialize the runtime with a specific model.
 
         Creates a new AsyncBithuman instance with the provided model path and
-        optional API secret.
+        optional API secret, or returns the one already loaded for them.
 
         Args:
             model_path: Path to the model file
             api_secret: BitHuman API secret for authentication (from settings.json)
+            set_current: Whether the runtime becomes the current one; pass False
+                for one-off uses such as generating a cover photo
 
         Returns:
             Initialized AsyncBithuman runtime
@@ -42,57 +73,169 @@ class RuntimeManager:
 
         if not visual_agent_model:
             raise ValueError("Visual Agent model path must be provided")
-        if not os.path.exists(visual_agent_model):
+        try:
+            stat = os.stat(visual_agent_model)
+        except FileNotFoundError:
             raise ValueError(
                 f"Visual Agent model file not found at: {visual_agent_model}"
-            )
+            ) from None
         if not bithuman_api_secret:
             raise ValueError("BitHuman API secret must be provided via settings.json")
 
+        cache_key = (
+            visual_agent_model,
+            bithuman_api_secret,
+            stat.st_mtime,
+            stat.st_size,
+        )
+        runtime = self._runtimes.get(cache_key)
+        if runtime is not None and runtime in self._retired:
+            # Never hand out a stopped runtime, load the model again instead
+            del self._runtimes[cache_key]
+            runtime = None
+        if runtime is not None:
+            logger.info("Reusing bitHuman runtime for model: {}", visual_agent_model)
+            self._runtimes.move_to_end(cache_key)
+            if set_current:
+                self.current_runtime = runtime
+                self.current_model_path = visual_agent_model
+            return runtime
+
+        task = self._pending.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._load_runtime(cache_key))
+            self._pending[cache_key] = task
+            task.add_done_callback(lambda _: self._pending.pop(cache_key, None))
+        else:
+            logger.info(
+                "Waiting for bitHuman runtime for model: {}", visual_agent_model
+            )
+
+        # Shielded so a cancelled caller does not abort a load others wait on
+        runtime = await asyncio.shield(task)
+        if set_current:
+            self.current_runtime = runtime
+            self.current_model_path = visual_agent_model
+        return runtime
+
+    def warmup(
+        self, model_path: str, api_secret: str | None = None
+    ) -> asyncio.Task | None:
+        """Start loading a model's runtime in the background.
+
+        A later create_runtime call for the same model and secret waits for this
+        load instead of starting another one.
+
+        Args:
+            model_path: Path to the model file
+            api_secret: BitHuman API secret for authentication (from settings.json)
+
+        Returns:
+            The warmup task, or None if the runtime could not be scheduled
+        """
         try:
+            task = asyncio.create_task(
+                self.create_runtime(model_path, api_secret, set_current=False)
+            )
+        except Exception as e:
+            logger.warning(f"Could not warm up bitHuman runtime: {e}")
+            return None
+
+        def log_failure(task: asyncio.Task) -> None:
+            if not task.cancelled() and task.exception() is not None:
+                logger.warning(f"bitHuman runtime warmup failed: {task.exception()}")
+
+        task.add_done_callback(log_failure)
+        return task
+
+    async def _load_runtime(self, cache_key: RuntimeKey) -> AsyncBithuman:
+        """Create a runtime and add it to the cache.
+
+        Args:
+            cache_key: Tuple of (model_path, api_secret, mtime, size)
+
+        Returns:
+            Initialized AsyncBithuman runtime
+        """
+        visual_agent_model, bithuman_api_secret, _, _ = cache_key
+        try:
+            # Arguments are only formatted when INFO records are emitted
             logger.info(
-                f"Initializing bitHuman runtime with model: {visual_agent_model}"
+                "Initializing bitHuman runtime with model: {}", visual_agent_model
             )
-            logger.info(f"API secret present: {bool(bithuman_api_secret)}")
 
             runtime = await AsyncBithuman.create(
                 model_path=visual_agent_model, api_secret=bithuman_api_secret
             )
             logger.info("bitHuman runtime initialized successfully")
-            self.current_runtime = runtime
-            self.current_model_path = visual_agent_model
+            self._runtimes[cache_key] = runtime
+            await self._evict_over_capacity(keep=cache_key)
             return runtime
         except Exception as e:
             error_msg = f"Failed to initialize bitHuman runtime: {e}"
-            logger.error(error_msg)
+            # Include the stack trace, rendered only when the record is emitted
+            logger.opt(exception=True).error(error_msg)
 
-            # Get detailed exception information
-            import traceback
-
-            logger.error(f"Stack trace: {traceback.format_exc()}")
+            message = str(e)
 
             # Check if API key related error
-            if (
-                "api_key" in str(e).lower()
-                or "api key" in str(e).lower()
-                or "auth" in str(e).lower()
-            ):
+            if _AUTH_RE.search(message):
                 logger.error(
                     "This appears to be an API key related error. Check that your BitHuman API key is correctly set in settings.json"
                 )
 
             # Check for network related errors
-            if (
-                "timeout" in str(e).lower()
-                or "connect" in str(e).lower()
-                or "network" in str(e).lower()
-            ):
+            if _NET_RE.search(message):
                 logger.error(
                     "This appears to be a network related error. Check your internet connection."
                 )
 
             raise RuntimeError(error_msg)
 
+    def retire(self, runtime: AsyncBithuman) -> None:
+        """Stop handing out a runtime that its owner stops, e.g. a closed runner.
+
+        Args:
+            runtime: The runtime that is stopped outside the cache
+        """
+        self._retired.add(runtime)
+        for key in [key for key, cached in self._runtimes.items() if cached is runtime]:
+            del self._runtimes[key]
+
+    async def evict(self, model_path: str) -> None:
+        """Release cached runtimes for a model that are not in use.
+
+        The current runtime is left loaded.
+
+        Args:
+            model_path: Path to the model file
+        """
+        for key in [key for key in self._runtimes if key[0] == model_path]:
+            if self._runtimes[key] is not self.current_runtime:
+                await self._release(self._runtimes.pop(key))
+
+    async def _evict_over_capacity(self, keep: RuntimeKey) -> None:
+        """Release least recently used runtimes beyond RUNTIME_CACHE_SIZE.
+
+        Args:
+            keep: Key of the runtime that was just loaded, which is kept
+        """
+        for key in list(self._runtimes):
+            if len(self._runtimes) <= RUNTIME_CACHE_SIZE:
+                break
+            if key != keep and self._runtimes[key] is not self.current_runtime:
+                await self._release(self._runtimes.pop(key))
+
+    async def _release(self, runtime: AsyncBithuman) -> None:
+        """Stop a runtime that is no longer cached."""
+        if runtime in self._retired:
+            return  # already stopped by its owner
+        self._retired.add(runtime)
+        try:
+            await runtime.stop()
+        except Exception as e:
+            logger.warning(f"Error releasing bitHuman runtime: {e}")
+
     def create_visual_agent_options(
         self, first_frame: np.ndarray | None
     ) -> AvatarOptions:
@@ -112,26 +255,41 @@ class RuntimeManager:
                 f"Expected numpy array for first frame, got {type(first_frame)}"
             )
 
-        if len(first_frame.shape) != 3:
+        shape = first_frame.shape
+        if first_frame.ndim != 3:
+            raise ValueError(f"Expected 3D array for first frame, got shape {shape}")
+
+        if shape[2] != 3:
             raise ValueError(
-                f"Expected 3D array for first frame, got shape {first_frame.shape}"
+                f"Expected RGB image (3 channels), got {shape[2]} channels"
             )
 
-        if first_frame.shape[2] != 3:
-            raise ValueError(
-                f"Expected RGB image (3 channels), got {first_frame.shape[2]} channels"
+        # Anything else would be converted again by the JPEG encoders
+        if first_frame.dtype != np.uint8:
+            raise TypeError(
+                f"Expected uint8 pixels for first frame, got {first_frame.dtype}"
             )
 
-        output_width, output_height = first_frame.shape[1], first_frame.shape[0]
+        return self.create_visual_agent_options_from_shape(shape[0], shape[1])
 
-        if output_width <= 0 or output_height <= 0:
-            raise ValueError(
-                f"Invalid frame dimensions: {output_width}x{output_height}"
-            )
+    def create_visual_agent_options_from_shape(
+        self, height: int, width: int
+    ) -> AvatarOptions:
+        """Create visual agent options for frames of a known size.
+
+        Args:
+            height: Frame height in pixels
+            width: Frame width in pixels
+
+        Returns:
+            AvatarOptions for the visual agent runner
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError(f"Invalid frame dimensions: {width}x{height}")
 
         return AvatarOptions(
-            video_width=output_width,
-            video_height=output_height,
+            video_width=width,
+            video_height=height,
             video_fps=25,
             audio_sample_rate=16000,
             audio_channels=1,
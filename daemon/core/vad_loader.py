@@ -0,0 +1,28 @@
+"""Process-wide Silero VAD instance shared by every model load."""
+
+import threading
+
+from livekit.agents import vad
+from livekit.plugins import silero
+
+_vad: vad.VAD | None = None
+_vad_lock = threading.Lock()
+
+
+def get_vad() -> vad.VAD:
+    """Return the shared VAD, loading the ONNX model on first use.
+
+    Safe to call from a worker thread, so startup can warm it up off the
+    event loop while reloads and mode switches reuse the same instance.
+    """
+    global _vad
+
+    with _vad_lock:
+        if _vad is None:
+            _vad = silero.VAD.load(
+                min_speech_duration=0.05,
+                min_silence_duration=2,
+                activation_threshold=0.1,
+                sample_rate=8000,
+            )
+        return _vad
@@ -1,5 +1,7 @@
 """Voice agent and audio input/output handling for the bitHuman Visual Agent Application."""
 
+from functools import lru_cache
+
 from livekit.agents import utils
 from livekit.agents.voice import Agent
 from livekit.plugins import openai
@@ -7,6 +9,18 @@ from livekit.plugins import openai
 from daemon.utils import assets_manager
 
 
+@lru_cache(maxsize=4)
+def _get_realtime_model(
+    voice: str, api_key: str, model: str
+) -> openai.realtime.RealtimeModel:
+    """Return a RealtimeModel shared by every agent with the same settings.
+
+    The model only holds configuration, each agent session opens its own
+    realtime connection. A changed voice or API key gets a new entry.
+    """
+    return openai.realtime.RealtimeModel(voice=voice, api_key=api_key, model=model)
+
+
 class VoiceAgent(Agent):
     """Agent implementation using voice models."""
 
@@ -20,7 +34,8 @@ class VoiceAgent(Agent):
         # Get OpenAI API key from settings
         api_key = assets_manager.get_api_key("openai")
 
-        # Ensure HTTP context is initialized
+        # Ensure HTTP context is initialized; it lives in a ContextVar, so
+        # every construction sets it up for the context it runs in
         try:
             utils.http_context._new_session_ctx()
         except Exception:
@@ -29,9 +44,7 @@ class VoiceAgent(Agent):
 
         super().__init__(
             instructions=instructions,
-            llm=openai.realtime.RealtimeModel(
-                voice=voice,
-                api_key=api_key,
-                model="gpt-4o-mini-realtime-preview-2024-12-17",
+            llm=_get_realtime_model(
+                voice, api_key, "gpt-4o-mini-realtime-preview-2024-12-17"
             ),
         )
@@ -22,19 +22,19 @@ Usage:
 #############################
 # Standard library imports
 #############################
-import argparse
 import asyncio
-import http.client
 import json
+import logging
+import mmap
 import os
+import random
 import signal
 import socket
 import sys
 import threading
-import time
-import traceback
 from typing import Optional, Tuple
 
+import aiohttp
 from livekit.agents import utils
 
 from daemon.core.model_loader import ModelLoader
@@ -51,42 +51,32 @@ from daemon.utils.logging import (
 )
 from daemon.web_service import create_app, init_socketio
 
+# Optional faster event loop, the default asyncio loop is used otherwise
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 
 #############################
 # Error Handling Setup
 #############################
-# Add stderr filtering to completely suppress common Werkzeug errors in logs
-class SuppressWerkzeugErrorFilter:
-    """Filter to suppress common Werkzeug errors from displaying in logs."""
-
-    def __init__(self, original_stderr):
-        """Initialize the filter with the original stderr object."""
-        self.original_stderr = original_stderr
-
-    def write(self, message):
-        """Filter and write messages to the original stderr."""
-        if "AssertionError: write() before start_response" not in message:
-            self.original_stderr.write(message)
-
-    def flush(self):
-        """Flush the original stderr buffer."""
-        self.original_stderr.flush()
+# Suppress a common, harmless Werkzeug error from the server logs
+class _WerkzeugNoiseFilter(logging.Filter):
+    """Filter out Werkzeug's "write() before start_response" errors."""
 
-    def __getattr__(self, attr):
-        """Delegate all other attributes to the original stderr."""
-        return getattr(self.original_stderr, attr)
+    def filter(self, record):
+        """Return False for records about the benign start_response error."""
+        return "write() before start_response" not in record.getMessage()
 
 
-# Apply the filter to sys.stderr
-sys.stderr = SuppressWerkzeugErrorFilter(sys.stderr)
+# Only Werkzeug's log records are checked, not every write to stderr
+logging.getLogger("werkzeug").addFilter(_WerkzeugNoiseFilter())
 
 
 #############################
 # Global variables
 #############################
-# Global event shared across modules to coordinate shutdown
-shutdown_event = threading.Event()
-
 # Global model loader instance accessible by web services and other components
 model_loader = None
 
@@ -94,19 +84,42 @@ model_loader = None
 _logging_configured = False
 _logging_lock = threading.Lock()
 
+
+def _configure_logging_once(**kwargs) -> bool:
+    """Configure logging unless that already happened.
+
+    Args:
+        **kwargs: Arguments for configure_logging
+
+    Returns:
+        True if this call configured logging
+    """
+    global _logging_configured
+
+    # Lock-free fast path once logging is set up; the flag is never reset
+    if _logging_configured:
+        return False
+    with _logging_lock:
+        if _logging_configured:
+            return False
+        configure_logging(**kwargs)
+        _logging_configured = True
+        return True
+
+
 # Setup user data directory and initialize settings
 user_data_dir = assets_manager.get_user_data_dir()
 settings = assets_manager.load_settings()
 
 # Ensure logging is configured properly (since we removed auto-initialization)
-with _logging_lock:
-    if not _logging_configured:
-        configure_logging()
-        _logging_configured = True
+_configure_logging_once()
 
 # Flag to indicate if shutdown is in progress
 shutting_down = False
 
+# Seconds a clean shutdown may take before the process exits anyway
+FORCE_EXIT_TIMEOUT = 10
+
 #############################
 # Utility Functions
 #############################
@@ -184,8 +197,15 @@ def get_server_port(specified_port: Optional[int] = None) -> int:
     max_port = assets_manager.get_setting("server.maxPort", 5010)
 
     # Try to find an available port
+    # The range is kept (rather than binding port 0) so clients can find the
+    # server by scanning it
     for port in range(start_port, max_port + 1):
         with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            # Ports in TIME_WAIT from a previous run are free for the server,
+            # which binds with SO_REUSEADDR too. On Windows the option would
+            # allow binding ports that are in use, so it is skipped there.
+            if os.name != "nt":
+                s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             try:
                 s.bind(("127.0.0.1", port))
                 # We can't update settings anymore since set_setting was removed
@@ -197,9 +217,12 @@ def get_server_port(specified_port: Optional[int] = None) -> int:
     raise RuntimeError(f"No available ports found between {start_port} and {max_port}")
 
 
-def wait_for_server_ready(port: int, timeout: int = 30) -> bool:
+async def wait_for_server_ready(port: int, timeout: int = 30) -> bool:
     """Wait until the server is ready to accept connections.
 
+    Polls with a single keep-alive session, starting at 50 ms between probes
+    and backing off (with jitter) to at most 500 ms.
+
     Args:
         port: The port to check
         timeout: Maximum time to wait in seconds
@@ -207,42 +230,43 @@ def wait_for_server_ready(port: int, timeout: int = 30) -> bool:
     Returns:
         True if the server is ready, False if timed out
     """
-    start_time = time.time()
-    # Poll until timeout
-    while time.time() - start_time < timeout:
-        try:
-            # Try both health endpoint and status endpoint
-            conn = http.client.HTTPConnection(f"127.0.0.1:{port}", timeout=1)
-
-            # First try /health endpoint (less likely to conflict)
+    loop = asyncio.get_running_loop()
+    start_time = loop.time()
+    interval = 0.05
+    reported = 0
+    async with aiohttp.ClientSession(
+        base_url=f"http://127.0.0.1:{port}",
+        timeout=aiohttp.ClientTimeout(total=1),
+    ) as session:
+        # Poll until timeout
+        while loop.time() - start_time < timeout:
             try:
-                conn.request("GET", "/health")
-                response = conn.getresponse()
-                if response.status == 200:
-                    log_server("Server health check successful")
-                    return True
-            except Exception:
-                pass  # Fall back to API status
-
-            # Fall back to the standard API status endpoint
-            try:
-                conn = http.client.HTTPConnection(f"127.0.0.1:{port}", timeout=1)
-                conn.request("GET", "/api/status")
-                response = conn.getresponse()
-                if response.status == 200:
-                    data = json.loads(response.read().decode("utf-8"))
-                    log_server(
-                        f"Server API status check successful: {data.get('is_ready', False)}"
-                    )
-                    return True
-            except Exception:
-                pass
-        except Exception:
-            pass
+                # /health is the cheaper check, /api/status is the fallback
+                async with session.get("/health") as response:
+                    if response.status == 200:
+                        log_server("Server health check successful")
+                        return True
+                    if response.status == 404:
+                        async with session.get("/api/status") as status_response:
+                            if status_response.status == 200:
+                                data = await status_response.json()
+                                is_ready = data.get("is_ready", False)
+                                log_server(
+                                    f"Server API status check successful: {is_ready}"
+                                )
+                                return True
+            # asyncio.TimeoutError is only the builtin from Python 3.11 on
+            except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):  # noqa: UP041
+                pass  # Server not accepting connections yet
+
+            # Wait before next attempt
+            await asyncio.sleep(interval * random.uniform(0.8, 1.2))
+            interval = min(interval * 2, 0.5)
 
-        # Wait before next attempt
-        time.sleep(1)
-        system(f"Waiting for server to be ready... ({int(time.time() - start_time)}s)")
+            elapsed = int(loop.time() - start_time)
+            if elapsed > reported:
+                reported = elapsed
+                system(f"Waiting for server to be ready... ({elapsed}s)")
 
     # Timeout reached
     return False
@@ -272,31 +296,27 @@ def resolve_model_path(model_path: Optional[str] = None) -> str:
     # Get settings
     settings = assets_manager.load_settings()
 
+    models_dir = os.path.join(user_data_dir, "assets", "models")
+
     # Second priority: model from settings
     if settings.get("model"):
         settings_model = settings["model"]
 
-        # Resolve the full path to the model
-        model_file_path = os.path.join(
-            user_data_dir, "assets", "models", settings_model
-        )
-
         # Add .imx extension if needed
-        if not os.path.exists(model_file_path) and not settings_model.endswith(".imx"):
-            model_file_path = os.path.join(
-                user_data_dir, "assets", "models", f"{settings_model}.imx"
-            )
-
-        if os.path.exists(model_file_path):
-            model_path = model_file_path
-            model(f"Using model from settings.json: {settings_model}")
-            return model_path
+        candidates = [settings_model]
+        if not settings_model.endswith(".imx"):
+            candidates.append(f"{settings_model}.imx")
+        for model_file in candidates:
+            model_file_path = os.path.join(models_dir, model_file)
+            if os.path.exists(model_file_path):
+                model(f"Using model from settings.json: {settings_model}")
+                return model_file_path
 
     # Third priority: default model
     default_model = assets_manager.get_setting(
-        "assets.defaultModel", "albert_einstein.imx"
+        "assets.defaultModel", "albert_einstein.imx", settings
     )
-    model_path = os.path.join(user_data_dir, "assets", "models", default_model)
+    model_path = os.path.join(models_dir, default_model)
 
     if settings.get("model"):
         warning(
@@ -313,41 +333,124 @@ def resolve_model_path(model_path: Optional[str] = None) -> str:
     raise FileNotFoundError(f"No valid model file found. Checked: {model_path}")
 
 
+def prefetch_model_file(model_path: str) -> None:
+    """Ask the OS to start reading the model file into the page cache.
+
+    The read-ahead runs in the kernel while the daemon sets up the web server
+    and the rest of the runtime, so the later model load finds the data
+    already in memory. Does nothing where madvise is unavailable (Windows).
+
+    Args:
+        model_path: Path to the model file
+    """
+    if not hasattr(mmap, "MADV_WILLNEED"):
+        return
+
+    try:
+        with open(model_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                mapped.madvise(mmap.MADV_WILLNEED)
+    except (OSError, ValueError) as e:
+        # Only a hint, the model still loads without it
+        warning(f"Could not prefetch model file: {e}", LogCategory.MODEL)
+
+
 #############################
 # Signal Handling
 #############################
 
 
-def signal_handler(signum, frame):
-    """Handle termination signals (SIGINT, SIGTERM).
-
-    Ensures graceful shutdown of all processes when the application
-    receives a termination signal.
+def _begin_shutdown() -> bool:
+    """Mark the daemon as shutting down.
 
-    Args:
-        signum: Signal number
-        frame: Current stack frame
+    Returns:
+        True for the first call, False if shutdown was already in progress
     """
     global shutting_down
     # Prevent multiple shutdown attempts
     if shutting_down:
-        return
+        return False
 
     system("\nShutting down...")
     shutting_down = True
-    shutdown_event.set()
+    return True
+
+
+def _force_exit(exit_code: int = 0):
+    """Exit immediately because clean shutdown took too long.
+
+    Args:
+        exit_code: Process exit code
+    """
+    system("Forcing exit...")
+    os._exit(exit_code)
+
+
+def _handle_loop_exception(loop: asyncio.AbstractEventLoop, context: dict) -> None:
+    """Log exceptions the event loop could not deliver to any awaiter.
+
+    Covers failed tasks nobody awaited and errors raised in loop callbacks,
+    which the default handler would write to stderr.
+
+    Args:
+        loop: The event loop reporting the error
+        context: Details passed by the loop, see loop.call_exception_handler
+    """
+    message = context.get("message") or "Unhandled exception in event loop"
+    # The task, future or callback handle says where the error came from
+    source = context.get("task") or context.get("future") or context.get("handle")
+    if source is not None:
+        message = f"{message} ({source!r})"
+    exception = context.get("exception")
+    if exception is not None:
+        message = f"{message}: {exception!r}"
+    error(message, LogCategory.SYSTEM, exc_info=exception or False)
+
+
+def _install_signal_handlers(
+    loop: asyncio.AbstractEventLoop,
+    shutdown: asyncio.Event,
+    grace_period: float = FORCE_EXIT_TIMEOUT,
+) -> None:
+    """Handle termination signals (SIGINT, SIGTERM) on the event loop.
+
+    The first signal sets the shutdown event and gives clean shutdown
+    grace_period seconds before the process exits anyway. A second SIGINT
+    exits right away, so a hung cleanup can be escaped from the terminal.
+    On Windows, SIGBREAK (Ctrl+Break) is handled like SIGTERM.
 
-    # Force exit after a timeout if clean shutdown is taking too long
-    def force_exit_after_timeout():
-        """Force exit if clean shutdown takes too long."""
-        time.sleep(10)  # Give clean shutdown 10 seconds
-        system("Forcing exit...")
-        os._exit(0)
+    Args:
+        loop: The running event loop
+        shutdown: Event awaited by the application to stop
+        grace_period: Seconds clean shutdown may take
+    """
 
-    # Start a thread to force exit if clean shutdown takes too long
-    force_exit_thread = threading.Thread(target=force_exit_after_timeout)
-    force_exit_thread.daemon = True
-    force_exit_thread.start()
+    def handle_signal(signum):
+        # Exit codes follow the shell convention of 128 + signal number
+        exit_code = 128 + signum
+        if not _begin_shutdown():
+            if signum == signal.SIGINT:
+                _force_exit(exit_code)
+            return
+        shutdown.set()
+        # Force exit if clean shutdown takes too long, no thread needed
+        loop.call_later(grace_period, _force_exit, exit_code)
+
+    signums = [signal.SIGINT, signal.SIGTERM]
+    # Windows consoles deliver Ctrl+Break as SIGBREAK rather than SIGTERM
+    if hasattr(signal, "SIGBREAK"):
+        signums.append(signal.SIGBREAK)
+
+    for signum in signums:
+        try:
+            loop.add_signal_handler(signum, handle_signal, signum)
+        except NotImplementedError:
+            # Windows loops have no add_signal_handler, hand the signal over
+            # to the loop from a regular handler instead
+            signal.signal(
+                signum,
+                lambda sig, frame: loop.call_soon_threadsafe(handle_signal, sig),
+            )
 
 
 #############################
@@ -371,12 +474,18 @@ class ApplicationManager:
     SocketIO communications, model loading, and UI state management.
     """
 
-    def __init__(self, model_path: Optional[str] = None, port: Optional[int] = None):
+    def __init__(
+        self,
+        model_path: str | None = None,
+        port: int | None = None,
+        shutdown_event: asyncio.Event | None = None,
+    ):
         """Initialize the application manager.
 
         Args:
             model_path: Path to the Visual Agent model file (.imx)
             port: Port to use for the web server
+            shutdown_event: Event that stops the application once set
         """
         # Store configuration
         self.model_path = model_path
@@ -384,8 +493,15 @@ class ApplicationManager:
         self.api_secret = assets_manager.get_api_key("bithuman")
 
         # Runtime state
-        self.stop_event = threading.Event()
+        # Set on the event loop when the application should stop
+        self.shutdown_event = shutdown_event or asyncio.Event()
         self.server_threads = []
+        # Set by the web server thread right before it starts serving
+        self.server_started = threading.Event()
+        # Background coroutines (status monitor), cancelled on cleanup
+        self._tasks: list[asyncio.Task] = []
+        # Last loading state sent to clients
+        self._loading_state: bool | None = None
         self.socketio_instance = None
         self.flask_app = None
 
@@ -395,16 +511,13 @@ class ApplicationManager:
         Returns:
             Tuple of (success, error_message)
         """
-        global model_loader, _logging_configured, _logging_lock
+        global model_loader
 
         try:
             system("Setting up application components")
 
             # Configure logging only once (thread-safe)
-            with _logging_lock:
-                if not _logging_configured:
-                    configure_logging()
-                    _logging_configured = True
+            _configure_logging_once()
 
             # Initialize HTTP context for API communication
             system("Initializing HTTP context")
@@ -415,6 +528,9 @@ class ApplicationManager:
             model_loader = ModelLoader()
             system(f"Model loader initialized: {model_loader}")
 
+            # Start loading the runtime while the web server comes up
+            model_loader.runtime_manager.warmup(self.model_path, self.api_secret)
+
             # Create web application
             system("Creating Flask application")
             self.flask_app, self.socketio_instance = create_app(model_loader)
@@ -429,15 +545,20 @@ class ApplicationManager:
             system(f"Starting web server on port {self.port}")
             self._start_web_server()
 
-            # Allow time for the server to start up
-            time.sleep(1)
-
-            # Initialize the model
+            # Initialize the model while waiting for the server to be ready
             system(f"Initializing model: {self.model_path}")
-            success, error_msg = await model_loader.initialize_model(
-                self.model_path, api_secret=self.api_secret
+            server_ready, (success, error_msg) = await asyncio.gather(
+                self._wait_for_server(),
+                model_loader.initialize_model(
+                    self.model_path, api_secret=self.api_secret
+                ),
             )
 
+            if not server_ready:
+                error_msg = "Server failed to start within the timeout period"
+                error(error_msg, LogCategory.SERVER)
+                return False, error_msg
+
             if not success:
                 return False, error_msg
 
@@ -458,24 +579,27 @@ class ApplicationManager:
                 # Initialize socketio for video player
                 init_socketio(self.socketio_instance)
 
-            # Start UI state manager
-            self._start_ui_state_manager()
+            # Keep the UI loading state in sync with the model
+            model_loader.on_state_change(self._emit_loading_state)
+            self._emit_loading_state(model_loader.get_status())
 
             # Start status monitor
-            self._start_status_monitor()
+            self._tasks.append(asyncio.create_task(self._print_status()))
 
             return True, None
 
         except Exception as e:
             error_msg = f"Setup failed: {str(e)}"
-            error(error_msg, LogCategory.SYSTEM)
-            traceback.print_exc()
+            error(error_msg, LogCategory.SYSTEM, exc_info=True)
             return False, error_msg
 
     def _configure_web_server(self):
-        """Configure web server endpoints and event handlers."""
+        """Configure SocketIO event handlers.
+
+        HTTP routes, including /health and /api/constants, are registered by
+        create_app.
+        """
         socketio = self.socketio_instance
-        app = self.flask_app
 
         # Define a utility function to handle Werkzeug errors in socket emissions
         def safe_emit(socket_instance, event, data, **kwargs):
@@ -501,27 +625,25 @@ class ApplicationManager:
             # Get the request from the socket context
             from flask import request as flask_request
 
-            # Send welcome message to verify connection
-            safe_emit(
-                socketio, "server_message", {"message": "Welcome from the server!"}
-            )
-
-            # Send current status to the newly connected client
+            # Send the welcome message, status and loading state to the newly
+            # connected client as one event
             try:
                 status = model_loader.get_status()
+                is_loading = status.get("is_reloading", False) or not status.get(
+                    "is_ready", False
+                )
+                payload = {
+                    "message": "Welcome from the server!",
+                    "status": status,
+                    "loading": is_loading,
+                }
                 client_id = flask_request.sid if hasattr(flask_request, "sid") else None
                 if client_id:
                     # Send to specific client if we have its ID
-                    safe_emit(socketio, "status-update", status, to=client_id)
-                    # Also send loading state
-                    is_loading = status.get("is_reloading", False) or not status.get(
-                        "is_ready", False
-                    )
-                    safe_emit(socketio, "loading-state", is_loading, to=client_id)
+                    safe_emit(socketio, "init", payload, to=client_id)
                 else:
                     # Broadcast to all clients if no client ID available
-                    safe_emit(socketio, "status-update", status)
-                    safe_emit(socketio, "loading-state", is_loading)
+                    safe_emit(socketio, "init", payload)
             except Exception as e:
                 error(
                     f"Error sending initial status to client: {e}", LogCategory.SERVER
@@ -549,35 +671,6 @@ class ApplicationManager:
             # Echo back to confirm receipt
             socketio.emit("log_receipt", {"received": message})
 
-        # Add custom endpoints
-        try:
-            # Check existing routes to avoid adding duplicates
-            existing_routes = [str(rule.rule) for rule in app.url_map.iter_rules()]
-
-            if "/health" not in existing_routes:
-
-                @app.route("/health")
-                def health_check():
-                    """Health check endpoint for monitoring."""
-                    return {"status": "ok", "uptime": time.time()}
-
-            if "/api/constants" not in existing_routes:
-
-                @app.route("/api/constants")
-                def get_constants():
-                    """Provide constants and config values to clients."""
-                    settings = assets_manager.load_settings()
-                    return {
-                        "default_model_path": settings.get("assets", {}).get(
-                            "defaultModel", ""
-                        ),
-                        "default_image_path": settings.get("assets", {}).get(
-                            "defaultImage", ""
-                        ),
-                    }
-        except Exception as e:
-            warning(f"Error checking routes: {e}", LogCategory.SERVER)
-
     def _start_web_server(self):
         """Start the Flask/SocketIO web server in a separate thread."""
 
@@ -599,6 +692,7 @@ class ApplicationManager:
                 )
 
                 # Start the server
+                self.server_started.set()
                 self.socketio_instance.run(
                     self.flask_app,
                     host="127.0.0.1",
@@ -608,8 +702,7 @@ class ApplicationManager:
                     allow_unsafe_werkzeug=True,
                 )
             except Exception as e:
-                error(f"Error in Flask server: {e}", LogCategory.SERVER)
-                traceback.print_exc()
+                error(f"Error in Flask server: {e}", LogCategory.SERVER, exc_info=True)
 
         # Create and start the Flask server thread
         flask_thread = threading.Thread(target=run_flask_server)
@@ -617,121 +710,56 @@ class ApplicationManager:
         flask_thread.start()
         self.server_threads.append(flask_thread)
 
-    def _start_ui_state_manager(self):
-        """Start a thread to manage and update UI loading states."""
+    async def _wait_for_server(self) -> bool:
+        """Wait for the server thread to start serving, then probe it over HTTP.
 
-        def manage_loading_state():
-            try:
-                # Wait a bit to ensure the app is ready
-                time.sleep(2)
-
-                # Set initial loading state to true
-                ui("Setting initial loading state to true...")
-                try:
-                    # Use the model loader's safe emit method
-                    model_loader._emit_socketio_event("loading-state", True)
-                except Exception as e:
-                    error(f"Error emitting initial loading state: {e}", LogCategory.UI)
-
-                # Monitor loading state and update UI
-                is_loading_cleared = False
-                while not self.stop_event.is_set() and not shutdown_event.is_set():
-                    try:
-                        # Get current model status
-                        status = model_loader.get_status()
-                        is_ready = status.get("is_ready", False)
-                        is_reloading = status.get("is_reloading", False)
-
-                        # Model is ready and not currently reloading
-                        if is_ready and not is_reloading and not is_loading_cleared:
-                            ui("Model is ready, setting loading state to false")
-                            try:
-                                # Use model loader's safe emit method
-                                model_loader._emit_socketio_event(
-                                    "loading-state", False
-                                )
-                                is_loading_cleared = True
-                            except Exception as e:
-                                error(
-                                    f"Error emitting ready state: {e}", LogCategory.UI
-                                )
-                        # Model was ready but is now reloading
-                        elif is_reloading and is_loading_cleared:
-                            ui("Model is reloading, setting loading state to true")
-                            try:
-                                # Use model loader's safe emit method
-                                model_loader._emit_socketio_event("loading-state", True)
-                                is_loading_cleared = False
-                            except Exception as e:
-                                error(
-                                    f"Error emitting reloading state: {e}",
-                                    LogCategory.UI,
-                                )
-                    except Exception as e:
-                        error(f"Error checking model status: {e}", LogCategory.MODEL)
-                    # Check status periodically
-                    time.sleep(0.5)
-            except Exception as e:
-                error(f"Error in loading state manager: {e}", LogCategory.UI)
+        Returns:
+            True if the server is ready, False if it failed to start in time
+        """
+        # The thread gets here in well under a second unless setup failed
+        if not await asyncio.to_thread(self.server_started.wait, 5.0):
+            return False
+        return await wait_for_server_ready(self.port)
 
-        # Create and start the thread
-        loading_thread = threading.Thread(target=manage_loading_state)
-        loading_thread.daemon = True
-        loading_thread.start()
-        self.server_threads.append(loading_thread)
+    def _emit_loading_state(self, status):
+        """Tell clients whether the model is loading, when that has changed.
 
-    def _start_status_monitor(self):
-        """Start a thread for periodic status logging."""
+        Args:
+            status: Model loader status dictionary
+        """
+        is_loading = status.get("is_reloading", False) or not status.get(
+            "is_ready", False
+        )
+        if is_loading == self._loading_state:
+            return
 
-        def print_status():
-            while not self.stop_event.is_set() and not shutdown_event.is_set():
-                system("Server is running...", level="DEBUG")
-                time.sleep(30)  # Print status every 30 seconds
+        ui(f"Setting loading state to {str(is_loading).lower()}")
+        try:
+            # Use the model loader's safe emit method
+            model_loader._emit_socketio_event("loading-state", is_loading)
+            self._loading_state = is_loading
+        except Exception as e:
+            error(f"Error emitting loading state: {e}", LogCategory.UI)
 
-        # Create and start the thread
-        status_thread = threading.Thread(target=print_status)
-        status_thread.daemon = True
-        status_thread.start()
-        self.server_threads.append(status_thread)
+    async def _print_status(self):
+        """Log a status line every 30 seconds until shutdown."""
+        while not self.shutdown_event.is_set():
+            system("Server is running...", level="DEBUG")
+            try:
+                await asyncio.wait_for(self.shutdown_event.wait(), timeout=30)
+            except asyncio.TimeoutError:  # noqa: UP041 - not the builtin before 3.11
+                pass
 
     async def start_reload_handler(self):
         """Start the model reload event handler."""
         system("Starting reload event handler")
-        # Create a task to handle reload events in the background
-        asyncio_stop_event = asyncio.Event()
-
-        # Create a thread to monitor the stop events
-        def monitor_stop_events():
-            while not self.stop_event.is_set() and not shutdown_event.is_set():
-                time.sleep(0.5)
-
-            # Set the asyncio event when stop is requested
-            loop = asyncio.new_event_loop()
-            loop.run_until_complete(asyncio_stop_event.set())
-            loop.close()
-
-        # Start the monitor thread
-        monitor_thread = threading.Thread(target=monitor_stop_events)
-        monitor_thread.daemon = True
-        monitor_thread.start()
-        self.server_threads.append(monitor_thread)
-
-        # Start the reload handler
-        return await model_loader.handle_reload_events(asyncio_stop_event)
+        # Handle reload events until shutdown is requested
+        return await model_loader.handle_reload_events(self.shutdown_event)
 
     async def run(self):
         """Run the application main loop."""
         system("Starting main application loop")
         try:
-            # Wait for the server to be ready
-            if not wait_for_server_ready(self.port):
-                error(
-                    "Server failed to start within the timeout period",
-                    LogCategory.SERVER,
-                )
-                self.stop_event.set()
-                return False
-
             # Print server info for external clients to connect
             log_server(f"Server is ready on port {self.port}")
             system(f"Daemon server running at: http://127.0.0.1:{self.port}")
@@ -741,8 +769,7 @@ class ApplicationManager:
             await self.start_reload_handler()
 
             # Keep running until shutdown is requested
-            while not self.stop_event.is_set() and not shutdown_event.is_set():
-                await asyncio.sleep(0.5)
+            await self.shutdown_event.wait()
 
             return True
 
@@ -750,13 +777,20 @@ class ApplicationManager:
             system("Received cancellation signal")
             return True
         except Exception as e:
-            error(f"Error during application run: {e}", LogCategory.SYSTEM)
-            traceback.print_exc()
+            error(
+                f"Error during application run: {e}", LogCategory.SYSTEM, exc_info=True
+            )
             return False
 
     async def cleanup(self):
         """Clean up resources before application exit."""
         system("Cleaning up resources")
+        # Let the status monitor and reload handler finish
+        self.shutdown_event.set()
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
 
         try:
             # Clean up model loader resources
@@ -766,8 +800,7 @@ class ApplicationManager:
 
             system("Cleanup completed")
         except Exception as e:
-            error(f"Error during cleanup: {e}", LogCategory.SYSTEM)
-            traceback.print_exc()
+            error(f"Error during cleanup: {e}", LogCategory.SYSTEM, exc_info=True)
 
 
 #############################
@@ -775,31 +808,56 @@ class ApplicationManager:
 #############################
 
 
-async def async_main(model_path: Optional[str] = None, port: Optional[int] = None):
+async def async_main(
+    model_path: str | None = None,
+    port: int | None = None,
+    grace_period: float = FORCE_EXIT_TIMEOUT,
+):
     """Main async entry point for the daemon.
 
     Args:
         model_path: Path to the model file
         port: Port to use for the server
+        grace_period: Seconds clean shutdown may take after a signal
 
     Returns:
         Exit code (0 for success, non-zero for error)
     """
+    loop = asyncio.get_running_loop()
+    loop.set_exception_handler(_handle_loop_exception)
+
+    # Signals are delivered to the loop from here on
+    shutdown = asyncio.Event()
+    _install_signal_handlers(loop, shutdown, grace_period)
+
+    app_manager: ApplicationManager | None = None
     try:
-        # Check launcher results first
-        success, error_msg = check_launcher_results()
+        # Check launcher results, resolve the model path and pick the server
+        # port concurrently; they only read files and probe sockets
+        launcher_check, resolved_model_path, server_port = await asyncio.gather(
+            asyncio.to_thread(check_launcher_results),
+            asyncio.to_thread(resolve_model_path, model_path),
+            asyncio.to_thread(get_server_port, port),
+            return_exceptions=True,
+        )
+
+        # Launcher problems are reported first, as before
+        success, error_msg = launcher_check
         if not success:
             error(error_msg, LogCategory.SYSTEM)
             return 1
-
-        # Resolve model path
-        resolved_model_path = resolve_model_path(model_path)
+        for result in (resolved_model_path, server_port):
+            if isinstance(result, BaseException):
+                raise result
 
         # Print basic information
         system(f"Starting daemon with model: {resolved_model_path}")
+        await asyncio.to_thread(prefetch_model_file, resolved_model_path)
 
         # Create and initialize the application manager
-        app_manager = ApplicationManager(model_path=resolved_model_path, port=port)
+        app_manager = ApplicationManager(
+            model_path=resolved_model_path, port=server_port, shutdown_event=shutdown
+        )
 
         # Setup the application
         success, error_msg = await app_manager.setup()
@@ -816,21 +874,25 @@ async def async_main(model_path: Optional[str] = None, port: Optional[int] = Non
     except FileNotFoundError as e:
         error(str(e), LogCategory.MODEL)
         return 1
-    except KeyboardInterrupt:
-        system("Received keyboard interrupt")
+    except asyncio.CancelledError:
+        # Signals only set the shutdown event, so a cancelled main task means
+        # the loop itself is stopping; clean up and exit normally
+        system("Main task cancelled, shutting down")
         return 0
     except Exception as e:
-        error(f"Unexpected error: {e}", LogCategory.SYSTEM)
-        traceback.print_exc()
+        error(f"Unexpected error: {e}", LogCategory.SYSTEM, exc_info=True)
         return 1
     finally:
         # Ensure cleanup happens if app_manager was created
-        if "app_manager" in locals():
+        if app_manager is not None:
             await app_manager.cleanup()
 
 
 def run_daemon(
-    model_path: Optional[str] = None, port: Optional[int] = None, verbose: bool = False
+    model_path: str | None = None,
+    port: int | None = None,
+    verbose: bool = False,
+    grace_period: float | None = None,
 ) -> int:
     """Run the daemon with the specified configuration.
 
@@ -841,33 +903,42 @@ def run_daemon(
         model_path: Optional path to the Visual Agent model
         port: Optional port to use for the server
         verbose: Enable verbose logging
+        grace_period: Seconds clean shutdown may take after SIGINT or SIGTERM,
+            defaults to FORCE_EXIT_TIMEOUT
 
     Returns:
         Exit code (0 for success, non-zero for error)
     """
-    # Register signal handlers for clean shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
     # Configure logging
-    global _logging_configured, _logging_lock
     log_level = "DEBUG" if verbose else "INFO"
-    with _logging_lock:
-        if not _logging_configured:
-            configure_logging(level=log_level)
-            _logging_configured = True
-            system(f"Daemon logging configured with level: {log_level}")
+    if _configure_logging_once(level=log_level):
+        system(f"Daemon logging configured with level: {log_level}")
+
+    if grace_period is None:
+        grace_period = FORCE_EXIT_TIMEOUT
+
+    # uvloop does not support Windows
+    loop_factory = None
+    if uvloop is not None and sys.platform != "win32":
+        loop_factory = uvloop.new_event_loop
 
     try:
-        # Run the async main function in a new event loop
-        return asyncio.run(async_main(model_path=model_path, port=port))
-    except KeyboardInterrupt:
-        # Handle CTRL+C at the top level
-        return 0
+        main_coro = async_main(
+            model_path=model_path, port=port, grace_period=grace_period
+        )
+        if not hasattr(asyncio, "Runner"):
+            # Python < 3.11 has no Runner, pick the loop through the policy
+            if loop_factory is not None:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            return asyncio.run(main_coro)
+
+        # The Runner takes the loop factory directly instead of replacing the
+        # process-wide event loop policy
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(main_coro)
     except Exception as e:
         # Log any unhandled exceptions and exit
-        error(f"Fatal error: {e}", LogCategory.SYSTEM)
-        traceback.print_exc()
+        error(f"Fatal error: {e}", LogCategory.SYSTEM, exc_info=True)
         return 1
 
 
@@ -876,22 +947,16 @@ def run_daemon(
 #############################
 
 if __name__ == "__main__":
-    try:
-        # Parse command line arguments
-        parser = argparse.ArgumentParser(description="bitHuman Visual Agent Daemon")
-        parser.add_argument("--port", type=int, help="Specify port for the server")
-        parser.add_argument("--model", help="Path to the model file")
-        parser.add_argument(
-            "--verbose", "-v", action="store_true", help="Enable verbose logging"
+    # Only the parser is shared; importing daemon.__main__.main would load a
+    # second copy of this module under the name daemon.main
+    from daemon.__main__ import _get_parser
+
+    args = _get_parser().parse_args()
+    sys.exit(
+        run_daemon(
+            model_path=args.model,
+            port=args.port,
+            verbose=args.verbose,
+            grace_period=args.grace_period,
         )
-        args = parser.parse_args()
-
-        # Run the daemon with parsed arguments
-        exit_code = run_daemon(
-            model_path=args.model, port=args.port, verbose=args.verbose
-        )
-        sys.exit(exit_code)
-    except Exception as e:
-        print(f"Fatal error starting daemon: {str(e)}")
-        traceback.print_exc()
-        sys.exit(1)
+    )
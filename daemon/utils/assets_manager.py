@@ -1,6 +1,7 @@
 """Asset management and settings utilities for the bitHuman Visual Agent Application."""
 
 import asyncio
+import copy
 import json
 import os
 import platform
@@ -50,37 +51,85 @@ def get_settings_path() -> str:
     return os.path.join(get_user_data_dir(), "settings.json")
 
 
-def load_settings() -> Dict[str, Any]:
-    """Load settings from settings.json.
+# ((mtime_ns, size), settings) of the last settings.json that was parsed
+_settings_cache: tuple[tuple[int, int], dict[str, Any]] | None = None
+
+
+def clear_settings_cache() -> None:
+    """Forget the parsed settings so the next read re-reads settings.json.
+
+    Call this after writing settings.json from this process.
+    """
+    global _settings_cache
+
+    _settings_cache = None
+
+
+def _read_settings() -> dict[str, Any]:
+    """Return the parsed settings.json, shared between calls.
+
+    The parsed file is reused until its mtime or size changes. The returned
+    dict is the cached one and must not be modified.
 
     Returns:
         Dictionary of settings or empty dict if file cannot be loaded
     """
+    global _settings_cache
+
     settings_path = get_settings_path()
 
     try:
-        if os.path.exists(settings_path):
-            with open(settings_path) as f:
-                return json.load(f)
-        else:
-            info(f"Warning: Settings file not found at {settings_path}")
+        stat = os.stat(settings_path)
+    except FileNotFoundError:
+        info(f"Warning: Settings file not found at {settings_path}")
+        return {}
+    except OSError as e:
+        error(f"Error loading settings: {e}")
+        return {}
+
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _settings_cache
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        with open(settings_path) as f:
+            settings = json.load(f)
     except Exception as e:
         error(f"Error loading settings: {e}")
+        return {}
 
-    return {}
+    _settings_cache = (stamp, settings)
+    return settings
 
 
-def get_setting(path: str, default: Any = None) -> Any:
+def load_settings() -> Dict[str, Any]:
+    """Load settings from settings.json.
+
+    Returns:
+        Dictionary of settings or empty dict if file cannot be loaded; the
+        caller owns it and may modify it
+    """
+    return copy.deepcopy(_read_settings())
+
+
+def get_setting(
+    path: str, default: Any = None, settings: dict[str, Any] | None = None
+) -> Any:
     """Get a setting value using a dot notation path.
 
     Args:
         path: Path to the setting (e.g., "server.port")
         default: Default value if setting is not found
+        settings: Already loaded settings to read from instead of settings.json
 
     Returns:
-        Setting value or default
+        Setting value or default; dict and list values read from
+        settings.json are copies
     """
-    settings = load_settings()
+    shared = settings is None
+    if shared:
+        settings = _read_settings()
 
     # Split the path into parts
     parts = path.split(".")
@@ -93,6 +142,9 @@ def get_setting(path: str, default: Any = None) -> Any:
         else:
             return default
 
+    # Hand out copies of containers from the shared cache
+    if shared and isinstance(current, (dict, list)):
+        return copy.deepcopy(current)
     return current
 
 
@@ -752,31 +804,22 @@ class AssetsManager:
                 callback(f"Generating thumbnail for {model_name_without_ext}...", 0.5)
 
             # Get cover photo
-            temp_cover_path = await self._model_loader.get_cover_photo_from_model(
-                model_path
-            )
-            if not temp_cover_path or not os.path.exists(temp_cover_path):
+            cover_bytes = await self._model_loader.get_cover_photo_bytes(model_path)
+            if not cover_bytes:
                 error(f"Failed to generate cover photo for {model_path}")
                 return None
 
-            # Move to permanent location
+            # Write straight to the permanent location, no temporary file needed
             permanent_path = os.path.join(
                 self.images_dir, f"{model_name_without_ext}.jpg"
             )
-            import shutil
-
-            shutil.copy2(temp_cover_path, permanent_path)
+            async with aiofiles.open(permanent_path, "wb") as f:
+                await f.write(cover_bytes)
             info(f"Saved cover photo to {permanent_path}")
 
             if callback:
                 callback(f"Generated thumbnail for {model_name_without_ext}", 1.0)
 
-            # Clean up temporary file
-            try:
-                os.unlink(temp_cover_path)
-            except Exception:
-                pass
-
             return permanent_path
         except Exception as e:
             error(f"Error generating cover photo: {e}")
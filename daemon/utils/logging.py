@@ -32,6 +32,35 @@ _recent_messages_lock = threading.Lock()
 # Default deduplication timeout (in seconds)
 _DEDUPE_TIMEOUT = 1.0
 
+# Numeric severities shared by loguru and the standard logging fallback
+_LEVEL_NUMBERS = {
+    "TRACE": 5,
+    "DEBUG": 10,
+    "INFO": 20,
+    "SUCCESS": 25,
+    "WARNING": 30,
+    "ERROR": 40,
+    "CRITICAL": 50,
+}
+# What the configured sinks accept; updated by setup_logger
+_min_level_no = 0
+_debug_categories_enabled = True
+
+
+def is_enabled(level: str, category: "LogCategory") -> bool:
+    """Check whether a message would reach any sink.
+
+    Args:
+        level: Log level
+        category: Log category
+
+    Returns:
+        True if the configured sinks accept this level and category
+    """
+    if _LEVEL_NUMBERS.get(level.upper(), 0) < _min_level_no:
+        return False
+    return _debug_categories_enabled or category is not LogCategory.DEBUG
+
 
 def should_log_message(message: str, level: str, category: str) -> bool:
     """Check if a message should be logged based on deduplication logic.
@@ -167,7 +196,7 @@ def setup_logger(
         is_production: If True, use more compact output format
         log_file: Optional path to write logs to file
     """
-    global app_logger, _is_setup_in_progress
+    global app_logger, _is_setup_in_progress, _min_level_no, _debug_categories_enabled
 
     # Prevent recursive setup
     if _is_setup_in_progress.is_set():
@@ -184,6 +213,11 @@ def setup_logger(
         )
         debug_mode = level.upper() == "DEBUG" or assets_manager.get_debug_mode()
 
+        # Let the loggers drop messages early that no sink would accept; the
+        # file sink does not filter DEBUG-category records
+        _min_level_no = _LEVEL_NUMBERS.get(level.upper(), 0)
+        _debug_categories_enabled = debug_mode or bool(log_file)
+
         if USING_LOGURU:
             # Remove default loguru handler
             logger.remove()
@@ -302,18 +336,27 @@ class bitHumanLogger:
             level: Log level
             message: Log message
             category: Log category
-            **kwargs: Additional metadata to include in the log
+            **kwargs: Additional metadata to include in the log; pass
+                exc_info=True to attach the exception being handled
         """
+        # Skip dedupe bookkeeping and formatting for messages no sink accepts
+        if not is_enabled(level, category):
+            return
+
         # Check if we should deduplicate this message
         if not should_log_message(message, level, category.value):
             return
 
+        # Let loguru capture the current exception instead of formatting it here
+        exc_info = kwargs.pop("exc_info", False)
+
         # Add category metadata for the log record
         extras = {"category": category.value}
         extras.update(kwargs)
 
         # Call the appropriate log level function with properly escaped message
-        log_fn = getattr(self._logger, level.lower())
+        log_target = self._logger.opt(exception=exc_info) if exc_info else self._logger
+        log_fn = getattr(log_target, level.lower())
 
         # Always escape all curly braces in the message to prevent formatter exceptions
         # This ensures consistent behavior regardless of format specifiers or actual braces in text
@@ -395,12 +438,19 @@ class SimpleLogger:
             level: Log level
             message: Log message
             category: Log category
-            **kwargs: Additional metadata to include in the log
+            **kwargs: Additional metadata to include in the log; pass
+                exc_info=True to attach the exception being handled
         """
+        # Skip messages no handler accepts before deduplicating them
+        if not is_enabled(level, category):
+            return
+
         # Deduplicate messages
         if not should_log_message(message, level, category.value):
             return
 
+        exc_info = kwargs.get("exc_info", False)
+
         # Escape curly braces for consistent behavior
         message = message.replace("{", "{{").replace("}", "}}")
 
@@ -413,11 +463,11 @@ class SimpleLogger:
                 # Add a continuation marker to indent each line
                 formatted_message += f"\n                               | {line}"
             log_fn = getattr(self._logger, level.lower())
-            log_fn(formatted_message)
+            log_fn(formatted_message, exc_info=exc_info)
         else:
             # Single line message - original handling
             log_fn = getattr(self._logger, level.lower())
-            log_fn(f"[{category.value}] {message}")
+            log_fn(f"[{category.value}] {message}", exc_info=exc_info)
 
     # Implement all the same methods as bitHumanLogger with simpler implementation
     def trace(
@@ -448,12 +498,16 @@ class SimpleLogger:
     def error(
         self, message: str, category: LogCategory = LogCategory.SYSTEM, **kwargs
     ) -> None:
-        self._logger.error(f"[{category.value}] {message}")
+        self._logger.error(
+            f"[{category.value}] {message}", exc_info=kwargs.get("exc_info", False)
+        )
 
     def critical(
         self, message: str, category: LogCategory = LogCategory.SYSTEM, **kwargs
     ) -> None:
-        self._logger.critical(f"[{category.value}] {message}")
+        self._logger.critical(
+            f"[{category.value}] {message}", exc_info=kwargs.get("exc_info", False)
+        )
 
     # Convenience methods for different categories
     def system(self, message: str, level: str = "INFO", **kwargs) -> None:
@@ -5,7 +5,6 @@ This module provides API endpoints for model operations, including:
 - Cover photo generation
 """
 
-import asyncio
 import os
 import threading
 import traceback
@@ -136,7 +135,8 @@ def register_endpoints(app, model_loader):
 
             # Get cover photo from the model
             try:
-                cover_photo_path = asyncio.run(
+                # Runs on the daemon loop, which owns the runtime cache
+                cover_photo_path = model_loader.run_coroutine(
                     model_loader.get_cover_photo_from_model(model_path)
                 )
                 logger.info(f"Cover photo generation result: {cover_photo_path}")
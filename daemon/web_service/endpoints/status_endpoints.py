@@ -6,9 +6,10 @@ This module provides API endpoints for status information, including:
 - Mute control
 """
 
+import json
 import traceback
 
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, Response, jsonify, request
 from loguru import logger
 
 from daemon.utils import assets_manager
@@ -43,21 +44,29 @@ def register_endpoints(app, model_loader):
 
         return jsonify({"status": "ok", "uptime": time.time()})
 
+    # Serialized /api/constants body and the values it was built from
+    constants_cache = {"values": None, "body": None}
+
     @status_bp.route("/api/constants", methods=["GET"])
     def get_constants():
         """Get constants and defaults for the client."""
-        settings = assets_manager.load_settings()
-        return jsonify(
-            {
-                "default_model_path": settings.get("assets", {}).get(
-                    "defaultModel", ""
-                ),
-                "default_image_path": settings.get("assets", {}).get(
-                    "defaultImage", ""
-                ),
-                "default_voice": settings.get("assets", {}).get("defaultVoice", ""),
-            }
+        assets = assets_manager.get_setting("assets", {})
+        values = (
+            assets.get("defaultModel", ""),
+            assets.get("defaultImage", ""),
+            assets.get("defaultVoice", ""),
         )
+        if constants_cache["values"] != values:
+            default_model, default_image, default_voice = values
+            constants_cache["body"] = json.dumps(
+                {
+                    "default_model_path": default_model,
+                    "default_image_path": default_image,
+                    "default_voice": default_voice,
+                }
+            )
+            constants_cache["values"] = values
+        return Response(constants_cache["body"], mimetype="application/json")
 
     @status_bp.route("/api/toggle-mute", methods=["POST"])
     def toggle_mute():
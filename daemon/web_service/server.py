@@ -198,30 +198,17 @@ def _apply_werkzeug_patch():
 
 
 def _select_async_mode():
-    """Select the SocketIO async mode based on settings or available packages."""
-    # Get async mode from settings
-    async_mode = assets_manager.get_setting("server.asyncMode", "threading")
+    """Select the SocketIO async mode based on settings.
 
-    # Only try eventlet/gevent if explicitly configured
-    if async_mode == "eventlet":
-        try:
-            import eventlet
-
-            eventlet.monkey_patch()
-            log.info("Using eventlet for SocketIO")
-        except ImportError:
-            async_mode = "threading"
-            log.warning("Failed to import eventlet, falling back to threading mode")
-    elif async_mode == "gevent":
-        try:
-            import gevent
-            import gevent.monkey
-
-            gevent.monkey.patch_all()
-            log.info("Using gevent for SocketIO")
-        except ImportError:
-            async_mode = "threading"
-            log.warning("Failed to import gevent, falling back to threading mode")
+    Only threading is supported: the daemon runs asyncio and livekit in the
+    same process, and the monkey patching eventlet and gevent need breaks both.
+    """
+    async_mode = assets_manager.get_setting("server.asyncMode", "threading")
+    if async_mode != "threading":
+        log.warning(
+            f"SocketIO async mode {async_mode!r} is not supported, using threading"
+        )
+        async_mode = "threading"
     else:
         log.info(f"Using {async_mode} mode for SocketIO")
 
@@ -260,7 +247,7 @@ def _configure_request_logging(app):
             and not request.path == "/api/status"
         ):
             log.info(f"Request: {request.method} {request.path}")
-            if request.is_json and not request.path == "/api/status":
+            if request.is_json and log.isEnabledFor(logging.DEBUG):
                 log.debug(f"JSON Body: {request.get_json()}")
 
     @app.after_request
@@ -408,19 +408,18 @@ socket.on('connect', () => {
     // Fetch server mode
     fetchServerMode();
 
-    // Check model status immediately after connecting
-    fetch(`http://localhost:${config.SERVER_PORT}/api/status`)
-        .then(response => response.json())
-        .then(data => {
-            addDebugMessage('Model status: ' + JSON.stringify(data));
-            // If model is ready and not reloading, hide loading overlay
-            if (data.is_ready && !data.is_reloading) {
-                hideLoadingOverlay();
-            }
-        })
-        .catch(error => {
-            addDebugMessage('Error checking model status: ' + error.message);
-        });
+    // The model status arrives with the 'init' event
+});
+
+// Initial welcome message, status and loading state sent on connect
+socket.on('init', (data) => {
+    console.log('Received server message:', data.message);
+    addDebugMessage('Model status: ' + JSON.stringify(data.status));
+    if (data.loading) {
+        showLoadingOverlay();
+    } else {
+        hideLoadingOverlay();
+    }
 });
 
 // Add direct socket.io handler for loading state
@@ -525,11 +524,6 @@ require('electron').ipcRenderer.on('window-restarted', () => {
     window.removeEventListener('resize', handleSquareModeResize);
 });
 
-// Listen for server messages
-socket.on('server_message', (data) => {
-    console.log('Received server message:', data);
-});
-
 // Listen for log receipt confirmations
 socket.on('log_receipt', (data) => {
     console.log('Server confirmed receipt of log message:', data);